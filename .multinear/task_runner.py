@@ -1,4 +1,5 @@
 import sys
+import atexit
 import asyncio
 from pathlib import Path
 
@@ -10,7 +11,7 @@ if str(project_root) not in sys.path:
 # Import necessary components
 # ruff: noqa: E402
 from engine import TextToSQLEngine
-from formatters import wrap_sql, format_results_as_markdown_table
+from formatters import format_query_and_rationale, format_results_as_markdown_table
 
 from dotenv import load_dotenv
 
@@ -19,13 +20,36 @@ load_dotenv()
 # Initialize Text-to-SQL engine (consider if singleton is needed here)
 # For a simple task runner, initializing per run might be okay,
 # but initialize outside the function if the runner handles multiple tasks.
-sql_engine = TextToSQLEngine()
+# The response cache is disabled so that repeated runs of a task exercise the
+# model every time instead of replaying the first answer.
+sql_engine = TextToSQLEngine(cache_ttl=0)
+
+# Single event loop shared by all tasks, so the OpenAI client keeps its
+# connections warm instead of setting up a new loop per task
+_loop = asyncio.new_event_loop()
+atexit.register(_loop.close)
 
 
 def run_task(input: str):
     """
     Process the input user question using the Text-to-SQL engine.
 
+    Args:
+        input (str): The user question to process.
+
+    Returns:
+        dict: A dictionary containing the response and sources (SQL query).
+              Returns an error dictionary if processing fails.
+    """
+    # Run the async implementation on the shared event loop
+    return _loop.run_until_complete(run_task_async(input))
+
+
+async def run_task_async(input: str):
+    """
+    Async version of run_task, for callers that process several questions
+    concurrently (e.g. with asyncio.gather).
+
     Args:
         input (str): The user question to process.
 
@@ -34,8 +58,7 @@ def run_task(input: str):
               Returns an error dictionary if processing fails.
     """
     # Process the query using Text-to-SQL engine
-    # Use asyncio.run to call the async function from this sync function
-    sql_result = asyncio.run(sql_engine.process_query(input))
+    sql_result = await sql_engine.process_query(input)
 
     # Format the response
     if "error" in sql_result:
@@ -43,12 +66,8 @@ def run_task(input: str):
         return {"error": sql_result["error"]}
     else:
         # Format successful response
-        results_text = format_results_as_markdown_table(sql_result["results"])
-        response = (
-            f"Based on your question, I ran the following SQL query:\n"
-            f"```sql\n{wrap_sql(sql_result['query'])}\n```\n\n"
-            f"**Rationale:** {sql_result['rationale']}\n"
-            f"{results_text}"
-        )
+        response = format_query_and_rationale(
+            sql_result["query"], sql_result["rationale"]
+        ) + format_results_as_markdown_table(sql_result["results"])
 
         return {"output": response, "details": {"model": sql_engine.model}}
@@ -1,47 +1,62 @@
 """
 FastAPI server implementation for the Text-to-SQL application.
 Provides REST API endpoints for:
-- Chat interactions with SQL-powered responses
+- Chat interactions with SQL-powered responses (also streamed as Server-Sent Events)
 - Chat history management
 Also serves the static frontend files.
 
 The server uses FastAPI with CORS enabled and maintains chat sessions using an
-in-memory store.
+in-memory store, or Redis when REDIS_URL is set.
 """
 
+import os
+import json
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from typing import List
+from typing import List, Tuple
 
 from engine import TextToSQLEngine
-from session import SessionManager
+from session import SessionManager, RedisSessionManager
 from dotenv import load_dotenv
 
 from tracing import init_tracing
-from formatters import wrap_sql, format_results_as_markdown_table
+from formatters import format_query_and_rationale, format_results_as_markdown_table
 
 
 load_dotenv()
 
 app = FastAPI(title="Text-to-SQL Chat Application")
 
-# Configure CORS
+# Configure CORS. The bundled frontend is served from the same origin; list any
+# other allowed origins (comma-separated) in the CORS_ORIGINS environment variable.
+# Explicit lists let the middleware reuse precomputed headers instead of
+# echoing the request's origin and headers back on every request.
+cors_origins = os.getenv("CORS_ORIGINS", "http://127.0.0.1:8080,http://localhost:8080")
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
+    allow_origins=[origin.strip() for origin in cors_origins.split(",")],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
 )
 
+# Compress larger responses (e.g. wide result tables); level 5 balances speed
+# and ratio. Event streams are left uncompressed so that events are not buffered.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize Text-to-SQL engine (singleton)
 sql_engine = TextToSQLEngine()
 init_tracing(sql_engine)
 
-# Initialize SessionManager (singleton)
-session_manager = SessionManager()
+# Initialize SessionManager (singleton). Sessions are stored in Redis when
+# REDIS_URL is set, which is required to run the server with several workers.
+redis_url = os.getenv("REDIS_URL")
+session_manager = RedisSessionManager(redis_url) if redis_url else SessionManager()
 
 
 # Schemas
@@ -69,7 +84,7 @@ async def chat(body: NewChatMessage):
     """
     # Add user's message to history
     user_message = (body.message, True)
-    session_manager.add_message(body.session_id, user_message)
+    await session_manager.add_message(body.session_id, user_message)
 
     # Process the query using Text-to-SQL engine
     sql_result = await sql_engine.process_query(body.message)
@@ -79,28 +94,68 @@ async def chat(body: NewChatMessage):
         response = f"I encountered an error: {sql_result['error']}"
         sources = []
     else:
-        results_text = format_results_as_markdown_table(sql_result["results"])
-        response = (
-            f"Based on your question, I ran the following SQL query:\n"
-            f"```sql\n{wrap_sql(sql_result['query'])}\n```\n\n"
-            f"**Rationale:** {sql_result['rationale']}\n"
-            f"{results_text}"
-        )
+        response = format_query_and_rationale(
+            sql_result["query"], sql_result["rationale"]
+        ) + format_results_as_markdown_table(sql_result["results"])
         sources = [sql_result["query"]]
 
     # Add AI's response to history
     ai_message = (response, False)
-    session_manager.add_message(body.session_id, ai_message)
+    await session_manager.add_message(body.session_id, ai_message)
 
     return ChatResponse(response=response, sources=sources)
 
 
-@app.get("/api/get-history", tags=["chat"])
+@app.post("/api/chat-stream", tags=["chat"])
+async def chat_stream(body: NewChatMessage):
+    """
+    Process a chat message like /api/chat, but stream the response as
+    Server-Sent Events, so the SQL query and rationale can be shown before
+    the query has been executed.
+
+    Each event is a JSON object with a "type" ("sql", "results" or "error")
+    and the markdown "text" to append to the response; a final "done" event
+    ends the stream.
+
+    Args:
+        body (NewChatMessage): The incoming chat message containing
+        the message text and session ID.
+
+    Returns:
+        StreamingResponse: The text/event-stream response.
+    """
+    # Add user's message to history
+    user_message = (body.message, True)
+    await session_manager.add_message(body.session_id, user_message)
+
+    async def events():
+        response = ""
+        async for event in sql_engine.stream_query(body.message):
+            if event["type"] == "sql":
+                text = format_query_and_rationale(event["query"], event["rationale"])
+            elif event["type"] == "results":
+                text = format_results_as_markdown_table(event["results"])
+            else:
+                text = f"I encountered an error: {event['error']}"
+            response += text
+            yield f"data: {json.dumps({'type': event['type'], 'text': text})}\n\n"
+
+        # Add AI's response to history
+        ai_message = (response, False)
+        await session_manager.add_message(body.session_id, ai_message)
+        yield f"data: {json.dumps({'type': 'done'})}\n\n"
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
+
+
+@app.get("/api/get-history", response_model=List[Tuple[str, bool]], tags=["chat"])
 async def get_history(session_id: str):
     """
     Retrieve the chat history for a given session.
     """
-    history = session_manager.get_history(session_id)
+    history = await session_manager.get_history(session_id)
     return history
 
 
@@ -1,47 +1,80 @@
 from sqlalchemy import create_engine, text
+from sqlalchemy.sql.elements import TextClause
 import os
-from typing import Dict
+import asyncio
+import functools
+from typing import AsyncIterator, Dict, List, Optional
+import re
 import json
+import random
+import hashlib
+import time
+import numpy as np
+from cachetools import TTLCache
+import openai
 from openai import AsyncOpenAI
-from datetime import datetime
-
-
-class TextToSQLEngine:
-    """
-    Text-to-SQL engine that converts natural language business questions
-    into SQLite queries, executes them, and returns the query, rationale,
-    and top 5 results.
-    """
-
-    def __init__(self):
-        """
-        Initialize the Text-to-SQL engine by setting up the database connection
-        and OpenAI API key.
-        """
-        # Initialize OpenAI client
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
-        self.client = AsyncOpenAI(api_key=api_key)
-
-        # Initialize the SQLite database connection
-        db_path = os.getenv("DATABASE_PATH", "sqlite:///data/windforest.db")
-        self.engine = create_engine(db_path)
-
-        # Define the OpenAI model to use
-        self.model = os.getenv("OPENAI_MODEL", "gpt-4o")
-
-        # Load the database schema
-        self.schema = self._load_schema()
-
-    def _load_schema(self) -> str:
-        """
-        Load the database schema from the generate.py file or define it manually.
+from datetime import date
+
+
+# Maximum number of result rows returned for a query
+ROW_LIMIT = 5
+
+# Single SELECT statement, and a LIMIT clause at its end
+_SELECT_RE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_LIMIT_RE = re.compile(
+    r"\bLIMIT\s+\d+(\s*(,|OFFSET)\s*\d+)?\s*;?\s*$", re.IGNORECASE
+)
+
+# OpenAI request timeout (seconds) and retries for transient errors
+OPENAI_TIMEOUT = 20.0
+OPENAI_MAX_RETRIES = 3
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+
+# Response cache defaults (repeat questions skip the OpenAI round-trip)
+CACHE_MAXSIZE = 4096
+CACHE_TTL = 3600  # seconds
+
+# Semantic cache defaults (paraphrased questions reuse an earlier answer)
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_MAXSIZE = 10000
+
+# Tool definition for SQL generation. Kept at module level so that its
+# serialized form is identical across requests (see OpenAI prompt caching).
+TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "generate_sql_query",
+            "description": "Generate an SQL query based on the user's "
+                           "business question.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "rationale": {
+                        "type": "string",
+                        "description": "The reasoning behind the SQL query"
+                                       "construction."
+                    },
+                    "query": {
+                        "type": "string",
+                        "description": "The SQL query to execute."
+                    }
+                },
+                "required": ["query", "rationale"],
+                "additionalProperties": False,
+            }
+        }
+    }
+]
 
-        Returns:
-            str: The database schema in SQL format.
-        """
-        schema = """
+# Database schema, matching the models in generate.py
+SCHEMA = """
         -- Database Schema
 
         CREATE TABLE customers (
@@ -201,52 +234,10 @@ class TextToSQLEngine:
             FOREIGN KEY(book_id) REFERENCES books(id)
         );
         """
-        return schema
+SCHEMA_HASH = hashlib.blake2b(SCHEMA.encode(), digest_size=8).hexdigest()
 
-    async def process_query(self, user_question: str) -> Dict:
-        """
-        Process a user business question by converting it to an SQLite query,
-        executing the query, and returning the query, rationale, and results.
-
-        Args:
-            user_question (str): The user's business question.
-
-        Returns:
-            Dict: A dictionary containing the SQL query, rationale, and results table.
-        """
-        # Get current date
-        current_date = datetime.now().strftime("%Y-%m-%d")
-
-        # Define the tool for SQL generation
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "generate_sql_query",
-                    "description": "Generate an SQL query based on the user's "
-                                   "business question.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "rationale": {
-                                "type": "string",
-                                "description": "The reasoning behind the SQL query"
-                                               "construction."
-                            },
-                            "query": {
-                                "type": "string",
-                                "description": "The SQL query to execute."
-                            }
-                        },
-                        "required": ["query", "rationale"],
-                        "additionalProperties": False,
-                    }
-                }
-            }
-        ]
-
-        # Add business context from generate.py
-        business_context = """
+# Business context from generate.py
+BUSINESS_CONTEXT = """
         Business Context:
         - Customers: Segmented into Retail, Wholesale, and VIP
           with varying purchase frequencies
@@ -261,18 +252,191 @@ class TextToSQLEngine:
         - Suppliers: Rated based on sales performance and stock management
         """
 
-        # Prepare the prompt
-        prompt = f"""
-        You are an SQL expert.
-        Convert the following business question into a precise SQLite query.
-        Current date: {current_date}
+# Per-request part of the prompt
+USER_PROMPT_TEMPLATE = "Current date: {current_date}\n\nUser Question: {user_question}"
+
+
+def _limit_rows(sql_query: str) -> str:
+    """
+    Make SQLite stop after ROW_LIMIT rows for a SELECT that has no LIMIT of its
+    own, instead of producing every row only for all but the first few to be
+    discarded.
+
+    Args:
+        sql_query (str): The generated SQL query.
+
+    Returns:
+        str: The query to execute.
+    """
+    query = sql_query.strip().rstrip(";")
+    if not _SELECT_RE.match(query) or ";" in query or _LIMIT_RE.search(query):
+        return sql_query
+    # Newlines keep a trailing "--" comment from swallowing the closing paren
+    return f"SELECT * FROM (\n{query}\n) LIMIT {ROW_LIMIT}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_clause(sql_query: str) -> TextClause:
+    """
+    Build the SQLAlchemy text construct for a query, reusing it when the model
+    generates the same SQL again (e.g. for a paraphrased question).
+    """
+    return text(sql_query)
+
+
+class SemanticCache:
+    """
+    Cache of responses keyed by question embeddings. A lookup returns the
+    response of the most similar cached question if its cosine similarity
+    reaches the threshold. The least recently used entry is evicted when
+    the cache is full.
+    """
+
+    def __init__(
+        self, threshold: float, ttl: int, maxsize: int = SEMANTIC_CACHE_MAXSIZE
+    ):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.size = 0
+        # Preallocated on first insert, once the embedding dimension is known
+        self.embeddings: Optional[np.ndarray] = None
+        self.added_at = np.zeros(maxsize)
+        self.last_used = np.zeros(maxsize)
+        self.results: List[Optional[Dict]] = [None] * maxsize
+
+    def get(self, embedding: np.ndarray) -> Optional[Dict]:
+        """
+        Find the cached response for the most similar question.
+
+        Args:
+            embedding (np.ndarray): Embedding of the user question.
+
+        Returns:
+            Optional[Dict]: The cached response, or None if no live entry is
+                similar enough.
+        """
+        if not self.size:
+            return None
+        now = time.monotonic()
+        # Rows are normalized on insert, so the dot product is the cosine
+        query = embedding / np.linalg.norm(embedding)
+        similarities = self.embeddings[:self.size] @ query
+        similarities[now - self.added_at[:self.size] > self.ttl] = -1.0
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        self.last_used[best] = now
+        return self.results[best]
+
+    def add(self, embedding: np.ndarray, result: Dict) -> None:
+        """
+        Store a response under the embedding of its question.
+
+        Args:
+            embedding (np.ndarray): Embedding of the user question.
+            result (Dict): The response to cache.
+        """
+        if self.embeddings is None:
+            self.embeddings = np.zeros((self.maxsize, len(embedding)), dtype=np.float32)
+        if self.size < self.maxsize:
+            index = self.size
+            self.size += 1
+        else:
+            index = int(np.argmin(self.last_used))
+        now = time.monotonic()
+        self.embeddings[index] = embedding / np.linalg.norm(embedding)
+        self.added_at[index] = now
+        self.last_used[index] = now
+        self.results[index] = result
+
+
+class TextToSQLEngine:
+    """
+    Text-to-SQL engine that converts natural language business questions
+    into SQLite queries, executes them, and returns the query, rationale,
+    and top 5 results.
+    """
+
+    def __init__(
+        self,
+        cache_ttl: Optional[int] = None,
+        semantic_cache_threshold: Optional[float] = None,
+    ):
+        """
+        Initialize the Text-to-SQL engine by setting up the database connection
+        and OpenAI API key.
+
+        Args:
+            cache_ttl (Optional[int]): Lifetime of cached responses in seconds.
+                Defaults to the QUERY_CACHE_TTL environment variable; 0 disables
+                the response cache.
+            semantic_cache_threshold (Optional[float]): Minimum cosine similarity
+                for a paraphrased question to reuse a cached response. Defaults to
+                the SEMANTIC_CACHE_THRESHOLD environment variable; when unset the
+                semantic cache is disabled.
+        """
+        # Initialize OpenAI client
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable not set")
+        # Retries are handled by the engine (see _create_completion)
+        self.client = AsyncOpenAI(
+            api_key=api_key, timeout=OPENAI_TIMEOUT, max_retries=0
+        )
+
+        # Initialize the SQLite database connection
+        db_path = os.getenv("DATABASE_PATH", "sqlite:///data/windforest.db")
+        self.engine = create_engine(db_path)
+        # SQLAlchemy pools SQLite file connections (QueuePool), so queries reuse
+        # open connections; open the first one now rather than on first request
+        with self.engine.connect():
+            pass
+
+        # Define the OpenAI model to use
+        self.model = os.getenv("OPENAI_MODEL", "gpt-4o")
+
+        # Database schema
+        self.schema = SCHEMA
+        self.schema_hash = SCHEMA_HASH
+
+        # Static part of the prompt, identical for every request
+        self.system_prompt = self._build_system_prompt()
+
+        # Cache of successful responses keyed by (model, schema, question)
+        if cache_ttl is None:
+            cache_ttl = int(os.getenv("QUERY_CACHE_TTL", CACHE_TTL))
+        self.cache = (
+            TTLCache(maxsize=CACHE_MAXSIZE, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
+
+        # Optional cache matching paraphrased questions by embedding similarity
+        if semantic_cache_threshold is None and os.getenv("SEMANTIC_CACHE_THRESHOLD"):
+            semantic_cache_threshold = float(os.getenv("SEMANTIC_CACHE_THRESHOLD"))
+        self.semantic_cache = (
+            SemanticCache(semantic_cache_threshold, cache_ttl)
+            if self.cache is not None and semantic_cache_threshold
+            else None
+        )
+
+    def _build_system_prompt(self) -> str:
+        """
+        Build the system prompt with the schema, business context and rules.
+
+        The prompt contains no per-request data, so OpenAI's automatic prompt
+        caching can reuse it as a shared prefix across requests.
+
+        Returns:
+            str: The system prompt.
+        """
+        return f"""
+        You are an expert in converting business questions into SQL queries.
+        Convert the user's business question into a precise SQLite query.
 
         Database Schema:
         {self.schema}
 
-        {business_context}
-
-        User Question: {user_question}
+        {BUSINESS_CONTEXT}
 
         Important:
         - Return only valid SQLite syntax
@@ -281,19 +445,182 @@ class TextToSQLEngine:
         - Limit results to 5 rows unless specified otherwise
         """
 
+    def _cache_key(self, user_question: str) -> str:
+        """
+        Build the response cache key for a user question.
+
+        Args:
+            user_question (str): The user's business question.
+
+        Returns:
+            str: Hex digest of the model, schema and normalized question.
+        """
+        normalized = " ".join(user_question.lower().split())
+        key = f"{self.model}|{self.schema_hash}|{normalized}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    async def process_query(self, user_question: str) -> Dict:
+        """
+        Process a user business question by converting it to an SQLite query,
+        executing the query, and returning the query, rationale, and results.
+        Successful responses are cached, so repeated questions skip the
+        OpenAI round-trip entirely.
+
+        Args:
+            user_question (str): The user's business question.
+
+        Returns:
+            Dict: A dictionary containing the SQL query, rationale, and results table.
+        """
+        result = {}
+        async for event in self.stream_query(user_question):
+            if event["type"] == "error":
+                return {"error": event["error"]}
+            result.update((key, value) for key, value in event.items() if key != "type")
+        return result
+
+    async def stream_query(self, user_question: str) -> AsyncIterator[Dict]:
+        """
+        Process a user business question step by step, yielding events as soon
+        as each step completes:
+
+        - {"type": "sql", "query": ..., "rationale": ...} once the query is generated
+        - {"type": "results", "results": [...]} once the query is executed
+        - {"type": "error", "error": ...} if a step failed (ends the stream)
+
+        Args:
+            user_question (str): The user's business question.
+
+        Yields:
+            Dict: The events described above.
+        """
+        key = embedding = cached = None
+        if self.cache is not None:
+            key = self._cache_key(user_question)
+            cached = self.cache.get(key)
+            if cached is None and self.semantic_cache is not None:
+                embedding = await self._embed(user_question)
+                if embedding is not None:
+                    cached = self.semantic_cache.get(embedding)
+                    if cached is not None:
+                        self.cache[key] = cached
+
+        if cached is not None:
+            yield {
+                "type": "sql",
+                "query": cached["query"],
+                "rationale": cached["rationale"],
+            }
+            yield {"type": "results", "results": cached["results"]}
+            return
+
+        sql_result = await self._generate_sql(user_question)
+        if "error" in sql_result:
+            yield {"type": "error", "error": sql_result["error"]}
+            return
+        yield {"type": "sql", **sql_result}
+
+        # Execute the SQL query with error handling. SQLite calls block, so
+        # they run in a worker thread to keep the event loop free.
+        try:
+            results_table = await asyncio.to_thread(
+                self._execute_sql, sql_result["query"]
+            )
+        except Exception as e:
+            yield {"type": "error", "error": f"SQL execution failed: {str(e)}"}
+            return
+        yield {"type": "results", "results": results_table}
+
+        # Only successful responses are cached, so that failures can be retried
+        if key is not None:
+            result = {**sql_result, "results": results_table}
+            self.cache[key] = result
+            if embedding is not None:
+                self.semantic_cache.add(embedding, result)
+
+    async def _embed(self, user_question: str) -> Optional[np.ndarray]:
+        """
+        Embed a user question for the semantic cache.
+
+        Args:
+            user_question (str): The user's business question.
+
+        Returns:
+            Optional[np.ndarray]: The embedding, or None if the API call failed
+                (the question is then answered without the semantic cache).
+        """
+        try:
+            response = await self.client.embeddings.create(
+                model=EMBEDDING_MODEL, input=user_question
+            )
+        except Exception:
+            return None
+        return np.asarray(response.data[0].embedding, dtype=np.float32)
+
+    def _execute_sql(self, sql_query: str) -> List[Dict]:
+        """
+        Execute a generated SQL query and fetch the first rows.
+
+        Args:
+            sql_query (str): The SQL query to execute.
+
+        Returns:
+            List[Dict]: Up to ROW_LIMIT result rows as dictionaries.
+        """
+        with self.engine.connect() as connection:
+            result = connection.execute(_text_clause(_limit_rows(sql_query)))
+            # Fetch rows as mappings and return them as plain dictionaries
+            return [dict(row) for row in result.mappings().fetchmany(ROW_LIMIT)]
+
+    async def _create_completion(self, **kwargs):
+        """
+        Create a chat completion, bounding each attempt by OPENAI_TIMEOUT and
+        retrying rate limits, timeouts and server errors with exponential
+        backoff and jitter.
+
+        Args:
+            **kwargs: Arguments for chat.completions.create.
+
+        Returns:
+            The chat completion.
+        """
+        for attempt in range(OPENAI_MAX_RETRIES + 1):
+            try:
+                return await asyncio.wait_for(
+                    self.client.chat.completions.create(**kwargs),
+                    timeout=OPENAI_TIMEOUT,
+                )
+            except _RETRYABLE_ERRORS:
+                if attempt == OPENAI_MAX_RETRIES:
+                    raise
+                await asyncio.sleep(0.5 * 2**attempt + random.random() * 0.3)
+
+    async def _generate_sql(self, user_question: str) -> Dict:
+        """
+        Generate an SQLite query for the question with OpenAI.
+
+        Args:
+            user_question (str): The user's business question.
+
+        Returns:
+            Dict: A dictionary containing the SQL query and rationale, or an
+                "error" key if generation failed.
+        """
+        # Only the current date and the question vary between requests; they go
+        # after the static system prompt so that OpenAI can reuse its prefix cache
+        prompt = USER_PROMPT_TEMPLATE.format(
+            current_date=date.today().isoformat(), user_question=user_question
+        )
+
         try:
             # Call OpenAI API with function calling
-            completion = await self.client.chat.completions.create(
+            completion = await self._create_completion(
                 model=self.model,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert in converting business questions "
-                                   "into SQL queries."
-                    },
+                    {"role": "system", "content": self.system_prompt},
                     {"role": "user", "content": prompt}
                 ],
-                tools=tools,
+                tools=TOOLS,
                 tool_choice={"type": "function", "function": {
                     "name": "generate_sql_query"
                 }}
@@ -318,23 +645,7 @@ class TextToSQLEngine:
             if not sql_query or not rationale:
                 return {"error": "Missing query or rationale in the response"}
 
-            # Execute the SQL query with error handling
-            try:
-                with self.engine.connect() as connection:
-                    result = connection.execute(text(sql_query))
-                    rows = result.fetchmany(5)
-                    columns = result.keys()
-
-                # Format results as a list of dictionaries
-                results_table = [dict(zip(columns, row)) for row in rows]
-
-                return {
-                    "query": sql_query,
-                    "rationale": rationale,
-                    "results": results_table
-                }
-            except Exception as e:
-                return {"error": f"SQL execution failed: {str(e)}"}
+            return {"query": sql_query, "rationale": rationale}
 
         except Exception as e:
             return {"error": f"OpenAI API call failed: {str(e)}"}
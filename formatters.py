@@ -1,3 +1,20 @@
+def _format_float(value):
+    return f"{value:,.2f}"
+
+
+def _format_int(value):
+    return f"{value:,}"
+
+
+# Formatters by exact type, covering the types SQLite returns
+_CELL_FORMATTERS = {
+    float: _format_float,
+    int: _format_int,
+    bool: _format_int,
+    str: str,
+}
+
+
 def format_cell_value(value):
     """Format a cell value for display in markdown table.
 
@@ -7,16 +24,24 @@ def format_cell_value(value):
     Returns:
         str: Formatted string representation of the value with thousand separators
     """
+    # A dict lookup on the exact type avoids isinstance checks for every cell
+    formatter = _CELL_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    # Subclasses of float/int (e.g. numpy scalars)
     if isinstance(value, float):
-        return f"{value:,.2f}"
+        return _format_float(value)
     if isinstance(value, int):
-        return f"{value:,}"
+        return _format_int(value)
     return str(value)
 
 
 def wrap_sql(sql: str, width: int = 60) -> str:
     """Wrap SQL query text at word boundaries.
 
+    Lines are at most `width` characters long, except for single words
+    longer than that, which get a line of their own.
+
     Args:
         sql: SQL query string to wrap
         width: Maximum line width (default: 60)
@@ -27,16 +52,17 @@ def wrap_sql(sql: str, width: int = 60) -> str:
     words = sql.split()
     lines = []
     current_line = []
-    current_length = 0
+    current_length = 0  # Length of the current line including separating spaces
 
+    # A hand-rolled loop is several times faster than textwrap.wrap here
     for word in words:
-        if current_length + len(word) + 1 <= width:
-            current_line.append(word)
-            current_length += len(word) + 1
-        else:
+        if current_line and current_length + 1 + len(word) > width:
             lines.append(" ".join(current_line))
             current_line = [word]
             current_length = len(word)
+        else:
+            current_length += len(word) + 1 if current_line else len(word)
+            current_line.append(word)
 
     if current_line:
         lines.append(" ".join(current_line))
@@ -44,6 +70,23 @@ def wrap_sql(sql: str, width: int = 60) -> str:
     return "\n".join(lines)
 
 
+def format_query_and_rationale(query: str, rationale: str) -> str:
+    """Format the generated SQL query and its rationale as markdown.
+
+    Args:
+        query: SQL query string
+        rationale: Explanation of the query
+
+    Returns:
+        str: Markdown text, to be followed by the results table
+    """
+    return (
+        f"Based on your question, I ran the following SQL query:\n"
+        f"```sql\n{wrap_sql(query)}\n```\n\n"
+        f"**Rationale:** {rationale}\n"
+    )
+
+
 def format_results_as_markdown_table(results):
     """Format SQL query results as a markdown table.
 
@@ -58,15 +101,18 @@ def format_results_as_markdown_table(results):
 
     # Get column headers from the first result
     headers = list(results[0].keys())
-
-    # Create markdown table header
-    table = "| " + " | ".join(headers) + " |\n"
-    # Add separator line
-    table += "| " + " | ".join(["---"] * len(headers)) + " |\n"
-    # Add data rows
-    for row in results:
-        table += (
-            "| " + " | ".join(format_cell_value(row[col]) for col in headers) + " |\n"
-        )
-
-    return f"\n**Results:**\n{table}"
+    format_cell = format_cell_value  # Local alias for the inner loop
+
+    # Collect table lines and join once instead of concatenating per row
+    lines = [
+        # Header and separator lines
+        "| " + " | ".join(headers) + " |",
+        "| " + " | ".join(["---"] * len(headers)) + " |",
+    ]
+    # Add data rows (a list comprehension avoids the generator overhead per row)
+    lines += [
+        "| " + " | ".join([format_cell(row[col]) for col in headers]) + " |"
+        for row in results
+    ]
+
+    return "\n**Results:**\n" + "\n".join(lines) + "\n"
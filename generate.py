@@ -1,25 +1,54 @@
 import logging
+import os
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     Integer,
     String,
     Float,
     Date,
     ForeignKey,
+    Index,
+    bindparam,
+    func,
     or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import (
+    declarative_base,
+    relationship,
+    sessionmaker,
+    backref,
+    selectinload,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker, backref
 from faker import Faker
 import random
 from datetime import datetime, timedelta
 import numpy as np
 import time
 import functools
+from bisect import bisect_right
+from collections import defaultdict
 
 # Initialize Faker for generating realistic fake data
 fake = Faker()
 
+# NumPy random generator for batched (vectorized) draws
+rng = np.random.default_rng()
+
+# Faker columns with at least this many rows are generated across the run's
+# process pool (see faker_executor), in chunks of FAKER_CHUNK_SIZE rows
+PARALLEL_FAKER_MIN_ROWS = 1000
+FAKER_CHUNK_SIZE = 256
+
+# Post-processing passes that walk a table once stream it in batches of this
+# many rows instead of materializing the whole result set
+STREAM_BATCH_SIZE = 2000
+
 # Configure logging to monitor the data generation process
 logging.basicConfig(
     level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s'
@@ -30,6 +59,21 @@ Base = declarative_base()
 engine = create_engine('sqlite:///data/windforest.db')  # SQLite database engine
 
 
+# Tune SQLite for the write-heavy generation workload. This engine is only
+# used to build the database from scratch (the app opens its own), so
+# durability is traded for speed: the rollback journal is kept in memory and
+# nothing is fsynced; a crashed run is simply regenerated. A larger page
+# cache, in-memory temp store and mmap cut page I/O.
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_conn, connection_record):
+    dbapi_conn.execute("PRAGMA journal_mode=MEMORY")
+    dbapi_conn.execute("PRAGMA synchronous=OFF")
+    dbapi_conn.execute("PRAGMA temp_store=MEMORY")
+    dbapi_conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    dbapi_conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    dbapi_conn.execute("PRAGMA busy_timeout=5000")
+
+
 # Define the Customer model representing customers in the database
 class Customer(Base):
     __tablename__ = 'customers'
@@ -160,6 +204,8 @@ class BookPriceHistory(Base):
     end_date = Column(Date, nullable=True)
     change_reason = Column(String)
     book = relationship("Book", back_populates="price_history")
+    # Covers the book_id/effective_date/end_date filter in get_price_at_date
+    __table_args__ = (Index('ix_bph_lookup', book_id, effective_date, end_date),)
 
 
 # Define the Book model representing products sold by the company
@@ -239,6 +285,7 @@ class Order(Base):
     shipper = relationship("Shipper", back_populates="orders")
     order_items = relationship("OrderItem", back_populates="order")
     interactions = relationship("CustomerServiceInteraction", back_populates="order")
+    __table_args__ = (Index('ix_order_customer', customer_id),)
 
 
 # Define the OrderItem model representing individual items within an order
@@ -251,6 +298,10 @@ class OrderItem(Base):
     unit_price = Column(Float)
     order = relationship("Order", back_populates="order_items")
     book = relationship("Book", back_populates="order_items")
+    __table_args__ = (
+        Index('ix_order_items_order', order_id),
+        Index('ix_order_items_book', book_id),
+    )
 
 
 # Create all tables in the database based on the defined models
@@ -262,39 +313,170 @@ Base.metadata.create_all(engine)
 
 
 # Data generation functions
-def generate_seasonal_date(start_date, end_date):
-    """Generate dates with higher probability during peak seasons."""
-    # Convert to datetime objects if strings
-    start = (
-        datetime.strptime(start_date, '%Y-%m-%d')
-        if isinstance(start_date, str)
-        else start_date
+# Relative probability of a date falling in each month (higher for Nov-Dec)
+SEASONAL_MONTH_WEIGHTS = {
+    11: 1.5,  # November
+    12: 1.8,  # December
+    1: 0.7,  # January (post-holiday slump)
+    7: 1.2,  # July (summer reading)
+    8: 1.2,  # August (back to school)
+}
+
+
+def _parse_date(value):
+    """Convert '%Y-%m-%d' strings to datetime objects, passing dates through."""
+    if isinstance(value, str):
+        return datetime.strptime(value, '%Y-%m-%d')
+    return value
+
+
+@functools.lru_cache(maxsize=32)
+def _seasonal_day_pmf(start, end):
+    """Return the probability of each day offset between start and end (inclusive)
+    under the seasonal month weights."""
+    days = np.datetime64(start.date() if isinstance(start, datetime) else start)
+    days = days + np.arange((end - start).days + 1)
+    months = days.astype('datetime64[M]').astype(int) % 12 + 1
+    month_weights = np.array(
+        [SEASONAL_MONTH_WEIGHTS.get(month, 1.0) for month in range(13)]
     )
-    end = (
-        datetime.strptime(end_date, '%Y-%m-%d')
-        if isinstance(end_date, str)
-        else end_date
+    weights = month_weights[months]
+    return weights / weights.sum()
+
+
+def generate_seasonal_dates(start_date, end_date, size):
+    """Generate `size` dates with higher probability during peak seasons."""
+    start = _parse_date(start_date)
+    end = _parse_date(end_date)
+    pmf = _seasonal_day_pmf(start, end)
+    offsets = rng.choice(len(pmf), size=size, p=pmf)
+    return [start + timedelta(days=int(offset)) for offset in offsets]
+
+
+def _fake_chunk(providers, size, seed):
+    """Generate `size` values for each Faker provider in a worker process."""
+    fake.seed_instance(seed)
+    return [[getattr(fake, provider)() for _ in range(size)] for provider in providers]
+
+
+def faker_executor():
+    """Create the process pool shared by fake_columns for a generation run.
+
+    Returns None on single-CPU machines, where worker processes would only
+    add start-up cost, so Faker runs serially in the calling process.
+    """
+    workers = os.cpu_count() or 1
+    if workers == 1:
+        return None
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def fake_columns(n, *providers, executor=None):
+    """Generate n values for each Faker provider (e.g. 'name', 'email').
+
+    With an executor (see faker_executor), large batches are split into
+    independently seeded chunks that are generated in its worker processes;
+    database inserts stay in the calling process. Returns one list per
+    provider.
+    """
+    if executor is None or n < PARALLEL_FAKER_MIN_ROWS:
+        return [[getattr(fake, provider)() for _ in range(n)] for provider in providers]
+
+    sizes = [
+        min(FAKER_CHUNK_SIZE, n - start) for start in range(0, n, FAKER_CHUNK_SIZE)
+    ]
+    seeds = [
+        int(seed_sequence.generate_state(1)[0])
+        for seed_sequence in np.random.SeedSequence().spawn(len(sizes))
+    ]
+    columns = [[] for _ in providers]
+    for chunk in executor.map(_fake_chunk, itertools.repeat(providers), sizes, seeds):
+        for column, values in zip(columns, chunk):
+            column.extend(values)
+    return columns
+
+
+def batch_choice(keys, weights, n):
+    """Draw n weighted samples from keys in one vectorized call.
+
+    Equivalent to n calls of random.choices(keys, weights)[0]: the cumulative
+    weights are searched with np.searchsorted. Returns an object array.
+    """
+    cum_weights = np.cumsum(weights, dtype=float)
+    cum_weights /= cum_weights[-1]
+    indexes = np.searchsorted(cum_weights, rng.random(n), side='right')
+    return np.asarray(keys, dtype=object)[indexes]
+
+
+@functools.lru_cache(maxsize=32)
+def _bulk_insert_sql(table_name, columns):
+    """Build the positional INSERT used by bulk_copy, once per table/columns."""
+    return (
+        f"INSERT INTO {table_name} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))})"
     )
 
-    # Generate random date
-    days_between = (end - start).days
-    random_days = random.randint(0, days_between)
-    date = start + timedelta(days=random_days)
-
-    # Adjust probability based on month (higher weights for Nov-Dec)
-    month_weights = {
-        11: 1.5,  # November
-        12: 1.8,  # December
-        1: 0.7,  # January (post-holiday slump)
-        7: 1.2,  # July (summer reading)
-        8: 1.2,  # August (back to school)
-    }
 
-    # If random number is greater than weight, try again
-    if random.random() > month_weights.get(date.month, 1.0):
-        return generate_seasonal_date(start_date, end_date)
+def bulk_copy(session, table, columns, rows):
+    """Bulk-load row tuples into a table through the raw DBAPI cursor.
+
+    Each row is a tuple of values in the order of columns. SQLite has no
+    COPY; its closest equivalent is a single prepared INSERT run with
+    cursor.executemany, which skips SQLAlchemy's per-row bind processing.
+    Values must therefore already be DBAPI-native (int, float, str, None),
+    with dates passed as ISO strings, the format SQLAlchemy's SQLite Date
+    type stores. Other dialects fall back to a Core executemany.
+    """
+    if not rows:
+        return
+    if session.get_bind().dialect.name != 'sqlite':
+        session.execute(table.insert(), [dict(zip(columns, row)) for row in rows])
+        return
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.executemany(_bulk_insert_sql(table.name, tuple(columns)), rows)
+    finally:
+        cursor.close()
 
-    return date
+
+def load_price_index(session):
+    """Load every book's price history into an in-memory interval index.
+
+    Returns {book_id: (effective_dates, periods)}, where effective_dates is
+    sorted and periods holds the matching (end_date, price) pairs, for
+    lookups with price_at_date.
+    """
+    price_index = defaultdict(lambda: ([], []))
+    rows = session.execute(
+        select(
+            BookPriceHistory.book_id,
+            BookPriceHistory.effective_date,
+            BookPriceHistory.end_date,
+            BookPriceHistory.price,
+        ).order_by(
+            BookPriceHistory.book_id,
+            BookPriceHistory.effective_date,
+            BookPriceHistory.id,
+        )
+    )
+    for book_id, effective_date, end_date, price in rows:
+        effective_dates, periods = price_index[book_id]
+        effective_dates.append(effective_date)
+        periods.append((end_date, price))
+    return price_index
+
+
+def price_at_date(price_index, book, date):
+    """Return the book's effective price on a date from a load_price_index()
+    index, matching Book.get_price_at_date without querying the database."""
+    effective_dates, periods = price_index.get(book.id, ((), ()))
+    # Latest period that started on or before the date and is still open
+    for index in range(bisect_right(effective_dates, date) - 1, -1, -1):
+        end_date, price = periods[index]
+        if end_date is None or end_date > date:
+            return price
+    return book.price
 
 
 # Define decorators to measure and log the duration of functions and simulation steps
@@ -303,15 +485,16 @@ def measure_duration(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        duration = time.time() - start_time
-        # Format duration with appropriate unit (ms if < 1s, s otherwise)
-        if duration < 1:
-            duration_str = "<1s"
-        else:
-            duration_str = f"{int(duration)}s"
-        logging.info(f" ↳ Completed in {duration_str}")
+        # Skip the formatting entirely when INFO logging is disabled
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            duration_ns = time.perf_counter_ns() - start_time
+            if duration_ns < 1_000_000_000:
+                duration_str = "<1s"
+            else:
+                duration_str = f"{duration_ns // 1_000_000_000}s"
+            logging.info(f" ↳ Completed in {duration_str}")
         return result
 
     return wrapper
@@ -323,15 +506,18 @@ def measure_step(description):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logging.info(f"→ {description}")
-            start_time = time.time()
+            log_enabled = logging.getLogger().isEnabledFor(logging.INFO)
+            if log_enabled:
+                logging.info(f"→ {description}")
+            start_time = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
-            if duration < 1:
-                duration_str = "<1s"
-            else:
-                duration_str = f"{int(duration)}s"
-            logging.info(f"   ↳ Completed in {duration_str}")
+            if log_enabled:
+                duration_ns = time.perf_counter_ns() - start_time
+                if duration_ns < 1_000_000_000:
+                    duration_str = "<1s"
+                else:
+                    duration_str = f"{duration_ns // 1_000_000_000}s"
+                logging.info(f"   ↳ Completed in {duration_str}")
             return result
 
         return wrapper
@@ -345,13 +531,14 @@ def measure_step(description):
 
 
 @measure_duration
-def generate_customers(session, n=1000):
+def generate_customers(session, n=1000, executor=None):
     """Generate a specified number of customer records with realistic
        demographics and behaviors.
 
     Args:
         session: SQLAlchemy session object for database interactions.
         n (int): Number of customers to generate.
+        executor: Optional process pool for Faker columns (see faker_executor).
     """
     logging.info(f"Generating {n} customers...")
 
@@ -405,125 +592,169 @@ def generate_customers(session, n=1000):
         },
     }
 
-    current_date = datetime.now().date()
+    # Determine purchase frequency based on segment
+    segment_frequency_weights = {
+        'Retail': [0.1, 0.3, 0.4, 0.2],  # Retail customers tend to be occasional
+        'Wholesale': [
+            0.3,
+            0.4,
+            0.2,
+            0.1,
+        ],  # Wholesale customers tend to be regular/frequent
+        'VIP': [0.4, 0.3, 0.2, 0.1],  # VIP customers tend to be frequent
+    }
 
-    for _ in range(n):
-        # Generate age using normal distribution (mean=35, std=12)
-        age = int(np.clip(np.random.normal(35, 12), 18, 80))
-
-        # Select segment
-        segment = random.choices(segments, weights=segment_weights)[0]
-
-        # Determine purchase frequency based on segment
-        segment_frequency_weights = {
-            'Retail': [0.1, 0.3, 0.4, 0.2],  # Retail customers tend to be occasional
-            'Wholesale': [
-                0.3,
-                0.4,
-                0.2,
-                0.1,
-            ],  # Wholesale customers tend to be regular/frequent
-            'VIP': [0.4, 0.3, 0.2, 0.1],  # VIP customers tend to be frequent
-        }
+    # Determine seasonal preference based on segment
+    segment_seasonal_weights = {
+        'Retail': list(seasonal_preferences.values()),
+        # Wholesale customers are more likely to be year-round
+        'Wholesale': [0.15, 0.15, 0.2, 0.5],
+        # VIP customers have stronger holiday preference
+        'VIP': [0.35, 0.15, 0.1, 0.4],
+    }
 
-        purchase_frequency = random.choices(
-            list(purchase_frequencies.keys()),
-            weights=segment_frequency_weights[segment],
-        )[0]
-
-        # Determine seasonal preference
-        seasonal_weights = list(seasonal_preferences.values())
-        if segment == 'Wholesale':
-            # Wholesale customers are more likely to be year-round
-            seasonal_weights = [0.15, 0.15, 0.2, 0.5]
-        elif segment == 'VIP':
-            # VIP customers have stronger holiday preference
-            seasonal_weights = [0.35, 0.15, 0.1, 0.4]
-
-        seasonal_preference = random.choices(
-            list(seasonal_preferences.keys()), weights=seasonal_weights
-        )[0]
-
-        # Calculate last purchase date based on frequency
-        days_since_purchase = {
-            'frequent': random.randint(1, 15),
-            'regular': random.randint(15, 45),
-            'occasional': random.randint(45, 120),
-            'rare': random.randint(120, 365),
-        }
-        last_purchase_date = current_date - timedelta(
-            days=days_since_purchase[purchase_frequency]
-        )
+    # Days since last purchase by frequency
+    days_since_purchase_ranges = {
+        'frequent': (1, 15),
+        'regular': (15, 45),
+        'occasional': (45, 120),
+        'rare': (120, 365),
+    }
 
-        # Calculate average order value
-        min_value, max_value = avg_order_values[segment][purchase_frequency]
-        avg_order_value = round(random.uniform(min_value, max_value), 2)
-
-        # Income level based on age and segment
-        base_income = np.random.normal(50000, 20000)
-        income_multipliers = {'Retail': 1, 'Wholesale': 1.5, 'VIP': 2.5}
-        age_factor = (
-            1 + 0.02 * (age - 25)
-            if age < 55
-            else 1 + 0.02 * (55 - 25) - 0.01 * (age - 55)
+    income_multipliers = {'Retail': 1, 'Wholesale': 1.5, 'VIP': 2.5}
+
+    frequency_multiplier = {
+        'frequent': 24,  # ~24 orders per year
+        'regular': 12,  # ~12 orders per year
+        'occasional': 4,  # ~4 orders per year
+        'rare': 2,  # ~2 orders per year
+    }
+
+    # Segment-specific retention rates for the CLV projection
+    retention_rates = {'Retail': 0.6, 'Wholesale': 0.8, 'VIP': 0.9}
+
+    # Enum-like columns are handled as small integer codes (indexes into these
+    # lists) and only mapped back to strings when the rows are built
+    frequency_names = list(purchase_frequencies.keys())
+    seasonal_names = list(seasonal_preferences.keys())
+
+    # Per-code lookup tables
+    income_multiplier_arr = np.array([income_multipliers[seg] for seg in segments])
+    retention_arr = np.array([retention_rates[seg] for seg in segments])
+    frequency_multiplier_arr = np.array(
+        [frequency_multiplier[freq] for freq in frequency_names]
+    )
+    days_since_purchase_arr = np.array(
+        [days_since_purchase_ranges[freq] for freq in frequency_names]
+    )
+    order_value_table = np.array(
+        [[avg_order_values[seg][freq] for freq in frequency_names] for seg in segments]
+    )
+
+    now = datetime.now()
+    current_date = now.date()
+
+    # Draw the per-customer random values for all customers at once
+    # Age uses a normal distribution (mean=35, std=12)
+    ages = np.clip(rng.normal(35, 12, n), 18, 80).astype(int)
+    segment_codes = rng.choice(len(segments), n, p=segment_weights)
+    base_incomes = rng.normal(50000, 20000, n)
+    # Most accounts within last 2 years
+    days_ago_arr = rng.exponential(365 * 2, n).astype(int)
+
+    frequency_codes = np.empty(n, dtype=int)
+    seasonal_codes = np.empty(n, dtype=int)
+    for code, segment in enumerate(segments):
+        mask = segment_codes == code
+        frequency_codes[mask] = rng.choice(
+            len(frequency_names),
+            size=mask.sum(),
+            p=segment_frequency_weights[segment],
         )
-        income_level = base_income * income_multipliers[segment] * age_factor
-
-        # Calculate Customer Lifetime Value (CLV) based on frequency and
-        # average order value
-        frequency_multiplier = {
-            'frequent': 24,  # ~24 orders per year
-            'regular': 12,  # ~12 orders per year
-            'occasional': 4,  # ~4 orders per year
-            'rare': 2,  # ~2 orders per year
-        }
+        seasonal_codes[mask] = rng.choice(
+            len(seasonal_names),
+            size=mask.sum(),
+            p=segment_seasonal_weights[segment],
+        )
+
+    # Generate the Faker fields for all customers up front
+    names, emails, phones, addresses = fake_columns(
+        n, 'name', 'email', 'phone_number', 'address', executor=executor
+    )
+
+    # Last purchase recency based on frequency
+    recency_ranges = days_since_purchase_arr[frequency_codes]
+    days_since_purchase = rng.integers(recency_ranges[:, 0], recency_ranges[:, 1] + 1)
+
+    # Average order value by segment and frequency
+    order_value_ranges = order_value_table[segment_codes, frequency_codes]
+    avg_order_value_arr = np.round(
+        rng.uniform(order_value_ranges[:, 0], order_value_ranges[:, 1]), 2
+    )
+
+    # Income level based on age and segment
+    age_factors = np.where(
+        ages < 55, 1 + 0.02 * (ages - 25), 1 + 0.02 * (55 - 25) - 0.01 * (ages - 55)
+    )
+    income_levels = np.round(
+        base_incomes * income_multiplier_arr[segment_codes] * age_factors, 2
+    )
 
-        # Project CLV over 3 years with segment-specific retention rates
-        retention_rates = {'Retail': 0.6, 'Wholesale': 0.8, 'VIP': 0.9}
-        yearly_value = avg_order_value * frequency_multiplier[purchase_frequency]
-        clv = 0
-        for year in range(3):
-            clv += yearly_value * (retention_rates[segment] ** year)
-        clv = round(clv, 2)
+    # Customer Lifetime Value (CLV) based on frequency and average order value,
+    # projected over 3 years with segment-specific retention rates (closed-form
+    # geometric sum of yearly_value * r**year)
+    yearly_values = avg_order_value_arr * frequency_multiplier_arr[frequency_codes]
+    retention = retention_arr[segment_codes]
+    clv_arr = np.round(yearly_values * (1 - retention**3) / (1 - retention), 2)
+
+    # Draw region, gender and contact method for all customers at once
+    regions_arr = batch_choice(regions, region_weights, n)
+    genders_arr = batch_choice(genders, gender_weights, n)
+    contact_methods_arr = batch_choice(contact_methods, contact_weights, n)
+
+    customers = []
+    for i in range(n):
+        last_purchase_date = current_date - timedelta(
+            days=int(days_since_purchase[i])
+        )
 
         # Account creation date with more recent bias
-        days_ago = int(
-            np.random.exponential(365 * 2)
-        )  # Most accounts within last 2 years
-        account_date = datetime.now() - timedelta(days=days_ago)
-
-        customer = Customer(
-            name=fake.name(),
-            email=fake.email(),
-            phone=fake.phone_number(),
-            address=fake.address(),
-            segment=segment,
-            region=random.choices(regions, weights=region_weights)[0],
-            age=age,
-            gender=random.choices(genders, weights=gender_weights)[0],
-            income_level=round(income_level, 2),
-            clv=clv,
-            account_creation_date=account_date,
-            preferred_contact_method=random.choices(
-                contact_methods, weights=contact_weights
-            )[0],
-            purchase_frequency=purchase_frequency,
-            seasonal_preference=seasonal_preference,
-            last_purchase_date=last_purchase_date,
-            avg_order_value=avg_order_value,
+        account_date = now - timedelta(days=int(days_ago_arr[i]))
+
+        customers.append(
+            dict(
+                name=names[i],
+                email=emails[i],
+                phone=phones[i],
+                address=addresses[i],
+                segment=segments[segment_codes[i]],
+                region=regions_arr[i],
+                age=int(ages[i]),
+                gender=genders_arr[i],
+                income_level=float(income_levels[i]),
+                clv=float(clv_arr[i]),
+                account_creation_date=account_date,
+                preferred_contact_method=contact_methods_arr[i],
+                purchase_frequency=frequency_names[frequency_codes[i]],
+                seasonal_preference=seasonal_names[seasonal_codes[i]],
+                last_purchase_date=last_purchase_date,
+                avg_order_value=float(avg_order_value_arr[i]),
+            )
         )
-        session.add(customer)
-    session.commit()
+
+    # Insert all customers with a single executemany
+    session.execute(Customer.__table__.insert(), customers)
 
 
 @measure_duration
-def generate_employees(session, n=50):
+def generate_employees(session, n=50, executor=None):
     """Generate a specified number of employee records, establishing
        an organizational hierarchy.
 
     Args:
         session: SQLAlchemy session object for database interactions.
         n (int): Number of employees to generate.
+        executor: Optional process pool for Faker columns (see faker_executor).
     """
     logging.info(f"Generating {n} employees...")
 
@@ -570,43 +801,72 @@ def generate_employees(session, n=50):
     employees_by_level = {level: [] for level in org_levels.keys()}
     all_employees = []
 
+    # Generate the Faker names for all employees up front
+    total = sum(level_counts.values())
+    first_names, last_names = fake_columns(
+        total, 'first_name', 'last_name', executor=executor
+    )
+
+    # Base salary ranges by level
+    base_salary_range = {
+        1: (300000, 500000),
+        2: (200000, 300000),
+        3: (150000, 200000),
+        4: (100000, 150000),
+        5: (70000, 100000),
+        6: (50000, 70000),
+    }
+
+    # Bonus percentages by level
+    bonus_percentages = {
+        1: (0.50, 1.00),  # 50-100% bonus potential
+        2: (0.30, 0.50),  # 30-50% bonus potential
+        3: (0.20, 0.30),  # 20-30% bonus potential
+        4: (0.15, 0.20),  # 15-20% bonus potential
+        5: (0.10, 0.15),  # 10-15% bonus potential
+        6: (0.05, 0.10),  # 5-10% bonus potential
+    }
+
+    department_names = list(departments.keys())
+    department_weights = list(departments.values())
+    # Entry levels more likely in Sales and Customer Service
+    entry_department_weights = [
+        weight * 1.5 if department in ('Sales', 'Customer Service') else weight
+        for department, weight in departments.items()
+    ]
+
+    today = datetime.now().date()
+
     # Generate employees level by level
     for level in sorted(org_levels.keys()):
         count = level_counts[level]
 
-        # Base salary ranges by level
-        base_salary_range = {
-            1: (300000, 500000),
-            2: (200000, 300000),
-            3: (150000, 200000),
-            4: (100000, 150000),
-            5: (70000, 100000),
-            6: (50000, 70000),
-        }
-
-        # Bonus percentages by level
-        bonus_percentages = {
-            1: (0.50, 1.00),  # 50-100% bonus potential
-            2: (0.30, 0.50),  # 30-50% bonus potential
-            3: (0.20, 0.30),  # 20-30% bonus potential
-            4: (0.15, 0.20),  # 15-20% bonus potential
-            5: (0.10, 0.15),  # 10-15% bonus potential
-            6: (0.05, 0.10),  # 5-10% bonus potential
-        }
-
-        for _ in range(count):
-            # Generate hire date with more senior levels having earlier dates
-            max_years_ago = 20 - (level * 2)  # More senior levels hired longer ago
-            min_years_ago = max(1, max_years_ago - 5)
-            hire_date = fake.date_between(
-                start_date=f'-{max_years_ago}y', end_date=f'-{min_years_ago}y'
-            )
+        # Per-level constants
+        min_salary, max_salary = base_salary_range[level]
+        min_bonus_pct, max_bonus_pct = bonus_percentages[level]
+        level_department_weights = (
+            entry_department_weights if level >= 5 else department_weights
+        )
+        # Generate hire dates with more senior levels having earlier dates,
+        # drawn uniformly as whole days ago
+        max_days_ago = (20 - (level * 2)) * 365  # More senior levels hired longer ago
+        min_days_ago = max(365, max_days_ago - 5 * 365)
+        hire_dates = [
+            today - timedelta(days=int(days_ago))
+            for days_ago in rng.integers(min_days_ago, max_days_ago, size=count)
+        ]
+
+        # Determine departments based on level and weights
+        level_departments = batch_choice(
+            department_names, level_department_weights, count
+        )
 
+        for hire_date, department in zip(hire_dates, level_departments):
             # 10% chance of terminated employment for non-management levels
             termination_date = None
             if level > 3 and random.random() < 0.1:
-                termination_date = fake.date_between(
-                    start_date=hire_date, end_date='today'
+                termination_date = hire_date + timedelta(
+                    days=random.randint(0, (today - hire_date).days)
                 )
 
             # KPI scores tend to be higher for more senior levels
@@ -614,33 +874,16 @@ def generate_employees(session, n=50):
             kpi_score = round(np.clip(np.random.normal(base_kpi, 0.3), 1, 5), 2)
 
             # Calculate salary with experience factor
-            min_salary, max_salary = base_salary_range[level]
-            experience_factor = (datetime.now().date() - hire_date).days / 365
+            experience_factor = (today - hire_date).days / 365
             salary = min_salary + (max_salary - min_salary) * (experience_factor / 20)
             salary = round(np.clip(salary, min_salary, max_salary), 2)
 
             # Calculate bonus based on KPI score and level
-            min_bonus_pct, max_bonus_pct = bonus_percentages[level]
             bonus_pct = min_bonus_pct + (max_bonus_pct - min_bonus_pct) * (
                 kpi_score / 5
             )
             bonus = round(salary * bonus_pct, 2)
 
-            # Determine department based on level and weights
-            if level <= 2:  # Top levels can be in any department
-                department = random.choices(
-                    list(departments.keys()), weights=list(departments.values())
-                )[0]
-            else:
-                # Adjust weights based on level
-                dept_weights = departments.copy()
-                if level >= 5:  # Entry levels more likely in Sales and Customer Service
-                    dept_weights['Sales'] *= 1.5
-                    dept_weights['Customer Service'] *= 1.5
-                department = random.choices(
-                    list(dept_weights.keys()), weights=list(dept_weights.values())
-                )[0]
-
             # Commission only for sales department
             commission = (
                 round(random.uniform(500, 5000), 2) if department == 'Sales' else 0
@@ -648,8 +891,8 @@ def generate_employees(session, n=50):
 
             # Create employee
             employee = Employee(
-                first_name=fake.first_name(),
-                last_name=fake.last_name(),
+                first_name=first_names[len(all_employees)],
+                last_name=last_names[len(all_employees)],
                 title=random.choice(org_levels[level]['titles']),
                 department=department,
                 hire_date=hire_date,
@@ -666,41 +909,47 @@ def generate_employees(session, n=50):
             employees_by_level[level].append(employee)
             all_employees.append(employee)
 
-    session.commit()  # Commit to get IDs assigned
+    session.flush()  # Flush to get IDs assigned
 
-    # Assign managers
-    for level in range(6, 1, -1):  # Start from bottom, excluding top level
-        for employee in employees_by_level[level]:
-            # Find potential managers (from level above)
-            potential_managers = [
-                m
-                for m in employees_by_level[level - 1]
-                if m.hire_date < employee.hire_date
-                and m.department == employee.department  # Same department
-                and len(m.direct_reports) < 8  # Limit direct reports
-            ]
+    # Group employees by (level, department) and track direct report counts
+    # locally instead of loading each manager's direct_reports
+    employees_by_dept = defaultdict(list)
+    for employee in all_employees:
+        employees_by_dept[(employee.level, employee.department)].append(employee)
+    report_counts = defaultdict(int)
 
-            if potential_managers:
-                # Prefer managers in same department with fewer direct reports
-                weighted_managers = [
-                    (m, 1 / (len(m.direct_reports) + 1)) for m in potential_managers
+    # Assign managers
+    with session.no_autoflush:
+        for level in range(6, 1, -1):  # Start from bottom, excluding top level
+            for employee in employees_by_level[level]:
+                # Find potential managers (from level above, same department)
+                potential_managers = [
+                    m
+                    for m in employees_by_dept[(level - 1, employee.department)]
+                    if m.hire_date < employee.hire_date
+                    and report_counts[m.id] < 8  # Limit direct reports
                 ]
-                manager = random.choices(
-                    [m[0] for m in weighted_managers],
-                    weights=[m[1] for m in weighted_managers],
-                )[0]
-                employee.manager = manager
 
-    session.commit()
+                if potential_managers:
+                    # Prefer managers with fewer direct reports
+                    weights = [
+                        1 / (report_counts[m.id] + 1) for m in potential_managers
+                    ]
+                    manager = random.choices(potential_managers, weights=weights)[0]
+                    employee.manager_id = manager.id
+                    report_counts[manager.id] += 1
+
+    session.flush()
 
 
 @measure_duration
-def generate_suppliers(session, n=100):
+def generate_suppliers(session, n=100, executor=None):
     """Generate a specified number of supplier records with realistic profiles.
 
     Args:
         session: SQLAlchemy session object for database interactions.
         n (int): Number of suppliers to generate.
+        executor: Optional process pool for Faker columns (see faker_executor).
     """
     logging.info(f"Generating {n} suppliers...")
 
@@ -717,26 +966,38 @@ def generate_suppliers(session, n=100):
         'Consignment': 0.1,
     }
 
-    for _ in range(n):
+    # Generate the Faker fields for all suppliers up front
+    company_names, contact_names, addresses = fake_columns(
+        n, 'company', 'name', 'address', executor=executor
+    )
+
+    supplier_locations = batch_choice(locations, location_weights, n)
+    supplier_terms = batch_choice(
+        list(contract_terms.keys()), list(contract_terms.values()), n
+    )
+
+    suppliers = []
+    for i in range(n):
         # Rating follows normal distribution centered at 3.5
         rating = round(np.clip(np.random.normal(3.5, 0.8), 1, 5), 2)
 
         # Relationship length follows exponential distribution
         relationship_length = int(np.random.exponential(5)) + 1  # Minimum 1 year
 
-        supplier = Supplier(
-            name=fake.company(),
-            contact_name=fake.name(),
-            address=fake.address(),
-            rating=rating,
-            location=random.choices(locations, weights=location_weights)[0],
-            contract_terms=random.choices(
-                list(contract_terms.keys()), weights=list(contract_terms.values())
-            )[0],
-            relationship_length=relationship_length,
+        suppliers.append(
+            dict(
+                name=company_names[i],
+                contact_name=contact_names[i],
+                address=addresses[i],
+                rating=rating,
+                location=supplier_locations[i],
+                contract_terms=supplier_terms[i],
+                relationship_length=relationship_length,
+            )
         )
-        session.add(supplier)
-    session.commit()
+
+    # Insert all suppliers with a single executemany
+    session.execute(Supplier.__table__.insert(), suppliers)
 
 
 @measure_duration
@@ -775,7 +1036,7 @@ def generate_categories(session, n=20):
         session.add(category)
         categories.append(category)
 
-    session.commit()  # Commit to get IDs for main categories
+    session.flush()  # Flush to get IDs for main categories
 
     # Create subcategories
     for main_category in categories:
@@ -789,23 +1050,28 @@ def generate_categories(session, n=20):
             )
             session.add(category)
 
-    session.commit()
+    session.flush()
 
 
 @measure_duration
-def generate_authors(session, n=500):
+def generate_authors(session, n=500, executor=None):
     """Generate a specified number of author records, some using pen names.
 
     Args:
         session: SQLAlchemy session object for database interactions.
         n (int): Number of authors to generate.
+        executor: Optional process pool for Faker columns (see faker_executor).
     """
     logging.info(f"Generating {n} authors...")
 
     # Generate birth dates for realistic age distribution
     current_year = datetime.now().year
 
-    for _ in range(n):
+    # Generate the Faker names for all authors up front
+    (names,) = fake_columns(n, 'name', executor=executor)
+
+    authors = []
+    for i in range(n):
         # Authors age distribution: mostly 30-70 years old
         birth_year = int(np.random.normal((current_year - 50), 12))
         birth_year = min(
@@ -815,7 +1081,7 @@ def generate_authors(session, n=500):
         # Some authors use pen names
         uses_pen_name = random.random() < 0.15  # 15% chance of pen name
 
-        name = fake.name()
+        name = names[i]
         if uses_pen_name:
             # Create a more artistic/memorable pen name
             if random.random() < 0.5:
@@ -823,24 +1089,21 @@ def generate_authors(session, n=500):
             else:
                 name = f"{fake.word().title()} {fake.word().title()}"
 
-        author = Author(name=name)
-        session.add(author)
+        authors.append(dict(name=name))
 
-        # Add batched commits
-        if _ % 100 == 0:
-            session.commit()
-
-    session.commit()
+    # Insert all authors with a single executemany
+    session.execute(Author.__table__.insert(), authors)
 
 
 @measure_duration
-def generate_books(session, n=5000):
+def generate_books(session, n=5000, executor=None):
     """Generate a specified number of book records with diverse attributes
        and relationships.
 
     Args:
         session: SQLAlchemy session object for database interactions.
         n (int): Number of books to generate.
+        executor: Optional process pool for Faker columns (see faker_executor).
     """
     logging.info(f"Generating {n} books...")
     suppliers = session.query(Supplier).all()
@@ -877,25 +1140,116 @@ def generate_books(session, n=5000):
         'Cost Change': 0.1,
     }
 
-    for _ in range(n):
-        # Select format based on weights
-        book_format = random.choices(
-            list(formats.keys()), weights=list(formats.values())
-        )[0]
+    # Titles are drawn from a smaller pool (duplicates are fine for fake data)
+    (title_pool,) = fake_columns(min(n, 2000), 'catch_phrase', executor=executor)
+    titles = random.choices(title_pool, k=n)
+    (isbns,) = fake_columns(n, 'isbn13', executor=executor)
+
+    # Draw formats, languages, base prices and stock levels for all books at once
+    format_names = np.array(list(formats.keys()))
+    format_codes = rng.choice(len(formats), size=n, p=list(formats.values()))
+    book_formats = format_names[format_codes]
+    book_languages = rng.choice(
+        list(languages.keys()), size=n, p=list(languages.values())
+    )
+    min_prices = np.array([price_ranges[name][0] for name in format_names])
+    max_prices = np.array([price_ranges[name][1] for name in format_names])
+    base_prices = np.round(
+        rng.uniform(min_prices[format_codes], max_prices[format_codes]), 2
+    )
+    mean_stocks = np.where(book_formats == 'E-book', 999999, 100)
+    stock_levels = np.clip(rng.normal(mean_stocks, 30), 0, mean_stocks * 2).astype(int)
+
+    # Price change reasons, excluding 'Initial Price'
+    change_reasons = list(price_change_reasons.keys())[1:]
+    change_reason_weights = np.array(list(price_change_reasons.values())[1:])
+    change_reason_weights /= change_reason_weights.sum()
+
+    # Price adjustment ranges by reason
+    adjustment_ranges = {
+        # Higher prices during peak seasons (see seasonal_adjustment_ranges)
+        'Seasonal Adjustment': (0.95, 1.05),
+        # Simulate price changes based on popularity
+        'Demand-Based': (0.9, 1.3),
+        # Usually results in price decrease
+        'Competitive Response': (0.8, 0.95),
+        # Temporary discounts
+        'Promotion': (0.7, 0.85),
+        # Small adjustments up or down
+        'Cost Change': (0.95, 1.05),
+    }
 
-        # Generate price based on format
-        min_price, max_price = price_ranges[book_format]
-        base_price = round(np.random.uniform(min_price, max_price), 2)
+    # Seasonal adjustment ranges by month
+    seasonal_adjustment_ranges = {
+        8: (1.1, 1.2),  # Back to school
+        9: (1.1, 1.2),
+        11: (0.8, 0.9),  # Holiday discounts
+        12: (0.8, 0.9),
+    }
+
+    today = datetime.now().date()
+
+    # Publication dates within the last 10 years, drawn as whole days ago
+    publication_days_ago = rng.integers(0, 10 * 365, size=n, endpoint=True)
+
+    # Price changes for all books at once: the number of changes depends on
+    # book age (average one change every 6 months), and each book's changes
+    # are stored contiguously, sorted by date, from change_starts[i]
+    change_counts = publication_days_ago // 180
+    change_starts = np.cumsum(change_counts) - change_counts
+    change_books = np.repeat(np.arange(n), change_counts)
+    change_days = rng.integers(
+        0, publication_days_ago[change_books], endpoint=True
+    )  # Days after publication
+    change_days = change_days[np.lexsort((change_days, change_books))]
+    change_dates = (
+        np.datetime64(today) - publication_days_ago[change_books] + change_days
+    )
+    change_months = change_dates.astype('datetime64[M]').astype(int) % 12 + 1
+
+    # Draw the reason and price adjustment for every change
+    change_reason_codes = rng.choice(
+        len(change_reasons), size=len(change_books), p=change_reason_weights
+    )
+    reason_lows = np.array([adjustment_ranges[reason][0] for reason in change_reasons])
+    reason_highs = np.array([adjustment_ranges[reason][1] for reason in change_reasons])
+    month_lows, month_highs = np.zeros(13), np.zeros(13)
+    for month in range(1, 13):
+        month_lows[month], month_highs[month] = seasonal_adjustment_ranges.get(
+            month, adjustment_ranges['Seasonal Adjustment']
+        )
+    is_seasonal = change_reason_codes == change_reasons.index('Seasonal Adjustment')
+    adjustments = rng.uniform(
+        np.where(
+            is_seasonal, month_lows[change_months], reason_lows[change_reason_codes]
+        ),
+        np.where(
+            is_seasonal, month_highs[change_months], reason_highs[change_reason_codes]
+        ),
+    )
+
+    # Plain Python lists are faster to index in the loop below
+    change_counts = change_counts.tolist()
+    change_starts = change_starts.tolist()
+    change_days = change_days.tolist()
+    change_reason_codes = change_reason_codes.tolist()
+    adjustments = adjustments.tolist()
+
+    # Rows are collected per book and inserted in bulk once all books exist
+    book_rows = []
+    book_price_histories = []
+    book_category_ids = []
+    book_author_ids = []
+
+    for i in range(n):
+        book_format = str(book_formats[i])
+        mean_stock = int(mean_stocks[i])
 
         # Adjust price based on publication date
-        publication_date = fake.date_between(start_date='-10y', end_date='today')
-        days_old = (datetime.now().date() - publication_date).days
+        days_old = int(publication_days_ago[i])
+        publication_date = today - timedelta(days=days_old)
         age_discount = max(0, (days_old / 365) * 0.1)  # 10% discount per year
-        price = round(base_price * (1 - age_discount), 2)
-
-        # Generate realistic stock levels
-        mean_stock = 100 if book_format != 'E-book' else 999999
-        stock_level = int(np.clip(np.random.normal(mean_stock, 30), 0, mean_stock * 2))
+        price = round(float(base_prices[i]) * (1 - age_discount), 2)
 
         # Safety stock and reorder points based on format
         if book_format != 'E-book':
@@ -905,110 +1259,45 @@ def generate_books(session, n=5000):
             safety_stock = 999999
             reorder_point = 999999
 
-        # Create and add book to session first
-        book = Book(
-            title=fake.catch_phrase(),
-            isbn=fake.isbn13(),
-            format=book_format,
-            language=random.choices(
-                list(languages.keys()), weights=list(languages.values())
-            )[0],
-            price=price,
-            stock_level=stock_level,
-            safety_stock=safety_stock,
-            reorder_point=reorder_point,
-            publication_date=publication_date,
-            supplier=random.choice(suppliers),
+        book_rows.append(
+            dict(
+                title=titles[i],
+                isbn=isbns[i],
+                format=book_format,
+                language=str(book_languages[i]),
+                price=price,
+                stock_level=int(stock_levels[i]),
+                safety_stock=safety_stock,
+                reorder_point=reorder_point,
+                publication_date=publication_date,
+                supplier_id=random.choice(suppliers).id,
+            )
         )
-        session.add(book)
-        session.flush()  # This ensures the book gets an ID
 
         # Create initial price history entry
-        initial_price = BookPriceHistory(
-            book=book,
-            price=price,
-            effective_date=publication_date,
-            change_reason='Initial Price',
-        )
-        session.add(initial_price)
+        # as [price, effective_date, end_date, change_reason]
+        price_history = [[price, publication_date, None, 'Initial Price']]
+        book_price_histories.append(price_history)
 
         # Generate historical price changes
         current_price = price
+        min_price, max_price = price_ranges[book_format]
 
-        # Number of price changes depends on book age
-        days_since_publication = (datetime.now().date() - publication_date).days
-        num_price_changes = int(
-            days_since_publication / 180
-        )  # Average one change every 6 months
-
-        if num_price_changes > 0:
-            # Generate price change dates
-            change_dates = sorted(
-                fake.date_between(start_date=publication_date, end_date='today')
-                for _ in range(num_price_changes)
-            )
+        for k in range(change_starts[i], change_starts[i] + change_counts[i]):
+            change_date = publication_date + timedelta(days=change_days[k])
 
-            for change_date in change_dates:
-                # Close previous price period
-                current_price_record = (
-                    session.query(BookPriceHistory)
-                    .filter(
-                        BookPriceHistory.book_id == book.id,
-                        BookPriceHistory.end_date.is_(None),
-                    )
-                    .first()
-                )
-                if current_price_record:
-                    current_price_record.end_date = change_date
-
-                # Calculate new price based on reason
-                reason = random.choices(
-                    list(price_change_reasons.keys())[1:],  # Exclude 'Initial Price'
-                    weights=list(price_change_reasons.values())[1:],
-                )[0]
-
-                # Price adjustment based on reason
-                if reason == 'Seasonal Adjustment':
-                    # Higher prices during peak seasons (e.g., back to school)
-                    month = change_date.month
-                    if month in [8, 9]:  # Back to school
-                        adjustment = random.uniform(1.1, 1.2)
-                    elif month in [11, 12]:  # Holiday season
-                        adjustment = random.uniform(0.8, 0.9)  # Holiday discounts
-                    else:
-                        adjustment = random.uniform(0.95, 1.05)
-
-                elif reason == 'Demand-Based':
-                    # Simulate price changes based on popularity
-                    adjustment = random.uniform(0.9, 1.3)
-
-                elif reason == 'Competitive Response':
-                    # Usually results in price decrease
-                    adjustment = random.uniform(0.8, 0.95)
-
-                elif reason == 'Promotion':
-                    # Temporary discounts
-                    adjustment = random.uniform(0.7, 0.85)
-
-                elif reason == 'Cost Change':
-                    # Small adjustments up or down
-                    adjustment = random.uniform(0.95, 1.05)
-
-                new_price = round(current_price * adjustment, 2)
-
-                # Ensure price doesn't go below minimum or above maximum
-                min_price, max_price = price_ranges[book_format]
-                new_price = max(min_price * 0.7, min(max_price * 1.3, new_price))
-
-                # Create new price history entry
-                price_history = BookPriceHistory(
-                    book=book,
-                    price=new_price,
-                    effective_date=change_date,
-                    change_reason=reason,
-                )
-                session.add(price_history)
-                current_price = new_price
+            # Close previous price period
+            price_history[-1][2] = change_date
+
+            new_price = round(current_price * adjustments[k], 2)
+
+            # Ensure price doesn't go below minimum or above maximum
+            new_price = max(min_price * 0.7, min(max_price * 1.3, new_price))
+
+            # Create new price history entry
+            reason = change_reasons[change_reason_codes[k]]
+            price_history.append([new_price, change_date, None, reason])
+            current_price = new_price
 
         # Assign 1-3 categories to each book based on logical relationships
         num_categories = random.randint(1, 3)
@@ -1041,25 +1330,67 @@ def generate_books(session, n=5000):
                 if siblings and random.random() < 0.3:  # 30% chance to include sibling
                     selected_categories.append(random.choice(siblings))
 
-        book.categories = selected_categories
+        book_category_ids.append([cat.id for cat in selected_categories])
 
         # Assign authors
-        book.authors = random.sample(authors, random.randint(1, 3))
-
-        # Commit every 1000 books to avoid memory issues
-        if _ % 1000 == 0:
-            session.commit()
+        book_author_ids.append(
+            [author.id for author in random.sample(authors, random.randint(1, 3))]
+        )
 
-    session.commit()
+    # Insert all books, returning their ids in the order of book_rows
+    book_table = Book.__table__
+    book_ids = session.scalars(
+        book_table.insert().returning(book_table.c.id, sort_by_parameter_order=True),
+        book_rows,
+    ).all()
+
+    # Bulk-load price history and author/category links referencing the new ids
+    bulk_copy(
+        session,
+        BookPriceHistory.__table__,
+        ('book_id', 'price', 'effective_date', 'end_date', 'change_reason'),
+        [
+            (
+                book_id,
+                float(price),
+                effective_date.isoformat(),
+                end_date.isoformat() if end_date else None,
+                str(change_reason),
+            )
+            for book_id, price_history in zip(book_ids, book_price_histories)
+            for price, effective_date, end_date, change_reason in price_history
+        ],
+    )
+    bulk_copy(
+        session,
+        BookCategory.__table__,
+        ('book_id', 'category_id'),
+        [
+            (book_id, category_id)
+            for book_id, category_ids in zip(book_ids, book_category_ids)
+            for category_id in category_ids
+        ],
+    )
+    bulk_copy(
+        session,
+        BookAuthor.__table__,
+        ('book_id', 'author_id'),
+        [
+            (book_id, author_id)
+            for book_id, author_ids in zip(book_ids, book_author_ids)
+            for author_id in author_ids
+        ],
+    )
 
 
 @measure_duration
-def generate_shippers(session, n=10):
+def generate_shippers(session, n=10, executor=None):
     """Generate a specified number of shipper records with performance metrics.
 
     Args:
         session: SQLAlchemy session object for database interactions.
         n (int): Number of shippers to generate.
+        executor: Optional process pool for Faker columns (see faker_executor).
     """
     logging.info(f"Generating {n} shippers...")
 
@@ -1075,42 +1406,48 @@ def generate_shippers(session, n=10):
     # Shipping cost models
     cost_models = {'Weight-based': 0.5, 'Distance-based': 0.3, 'Flat-rate': 0.2}
 
-    for _ in range(n):
-        # Generate realistic performance metrics
-        delivery_speed = round(
-            np.random.normal(4.2, 0.5), 2
-        )  # Most are good performers
-        reliability = round(
-            np.random.normal(0.95, 0.03), 3
-        )  # 95% reliable with small variance
-
-        # Calculate overall performance rating
-        performance_rating = round((delivery_speed + reliability * 5) / 2, 2)
-        performance_rating = min(max(performance_rating, 1), 5)  # Clip to 1-5 range
-
-        # Base cost varies by service area and cost model
-        base_cost = np.random.normal(15, 3)  # Mean $15, std dev $3
-        cost_model = random.choices(
-            list(cost_models.keys()), weights=list(cost_models.values())
-        )[0]
-
-        # Adjust base cost by cost model
-        if cost_model == 'Weight-based':
-            base_cost *= 1.2
-        elif cost_model == 'Distance-based':
-            base_cost *= 1.1
-
-        shipper = Shipper(
-            name=fake.company(),
-            phone=fake.phone_number(),
-            service_area=random.choices(
-                list(service_areas.keys()), weights=list(service_areas.values())
-            )[0],
-            base_cost=round(base_cost, 2),
-            performance_rating=performance_rating,
+    # Base cost multiplier by cost model
+    cost_model_multipliers = {'Weight-based': 1.2, 'Distance-based': 1.1}
+
+    shipper_cost_models = batch_choice(
+        list(cost_models.keys()), list(cost_models.values()), n
+    )
+    shipper_service_areas = batch_choice(
+        list(service_areas.keys()), list(service_areas.values()), n
+    )
+
+    # Generate realistic performance metrics for all shippers at once
+    delivery_speeds = np.round(rng.normal(4.2, 0.5, n), 2)  # Most are good performers
+    # 95% reliable with small variance
+    reliabilities = np.round(rng.normal(0.95, 0.03, n), 3)
+
+    # Calculate overall performance rating, clipped to the 1-5 range
+    performance_ratings = np.clip(
+        np.round((delivery_speeds + reliabilities * 5) / 2, 2), 1, 5
+    )
+
+    # Base cost (mean $15, std dev $3) adjusted by cost model
+    base_costs = rng.normal(15, 3, n) * np.array(
+        [cost_model_multipliers.get(model, 1) for model in shipper_cost_models]
+    )
+
+    company_names, phones = fake_columns(
+        n, 'company', 'phone_number', executor=executor
+    )
+
+    shippers = [
+        dict(
+            name=company_names[i],
+            phone=phones[i],
+            service_area=shipper_service_areas[i],
+            base_cost=round(float(base_costs[i]), 2),
+            performance_rating=float(performance_ratings[i]),
         )
-        session.add(shipper)
-    session.commit()
+        for i in range(n)
+    ]
+
+    # Insert all shippers with a single executemany
+    session.execute(Shipper.__table__.insert(), shippers)
 
 
 @measure_duration
@@ -1137,66 +1474,84 @@ def generate_orders(session, n=10000):
     payment_methods = ['Credit Card', 'PayPal', 'Gift Card']
     payment_weights = [0.65, 0.3, 0.05]
 
-    # Generate orders with seasonal patterns
-    start_date = datetime.now() - timedelta(days=365 * 5)  # 5 years ago
-    end_date = datetime.now()
-
-    for _ in range(n):
-        # Generate seasonal order date
-        order_date = generate_seasonal_date(start_date, end_date)
+    # Adjust tax rate based on region
+    base_tax_rate = 0.08  # 8% base tax rate
+    tax_multipliers = {
+        'North America': 1,
+        'Europe': 1.2,
+        'Asia': 0.9,
+        'South America': 0.85,
+        'Africa': 0.8,
+    }
 
-        # Simulate seasonal discounts
-        base_discount = np.random.exponential(5)  # Most discounts are small
+    # Generate seasonal order dates over the last 5 years
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=365 * 5)
+    order_dates = generate_seasonal_dates(start_date, end_date, n)
+    months = np.array([order_date.month for order_date in order_dates])
+
+    # Simulate seasonal discounts: most discounts are small, and they increase
+    # during the holiday season (x2) and back to school (x1.5)
+    discounts = np.round(
+        rng.exponential(5, n)
+        * np.where(
+            np.isin(months, [11, 12]), 2.0, np.where(np.isin(months, [7, 8]), 1.5, 1.0)
+        ),
+        2,
+    )
 
-        # Increase discounts during holiday seasons
-        if order_date.month in [11, 12]:  # Holiday season
-            discount = base_discount * 2
-        elif order_date.month in [7, 8]:  # Back to school
-            discount = base_discount * 1.5
-        else:
-            discount = base_discount
+    # Draw status, payment and shipping method for all orders at once
+    order_statuses = batch_choice(statuses, status_weights, n)
+    order_payment_methods = batch_choice(payment_methods, payment_weights, n)
+    order_shipping_methods = batch_choice(shipping_methods, shipping_weights, n)
+
+    # Simulate fraud patterns: 1% of orders are suspicious
+    suspicious = rng.random(n) < 0.01
+    order_statuses[suspicious] = 'Pending'
+    order_payment_methods[suspicious] = 'Gift Card'
+    order_shipping_methods[suspicious] = rng.choice(
+        ['Expedited', 'International'], size=suspicious.sum()
+    )
 
-        # Simulate fraud patterns
-        is_suspicious = random.random() < 0.01  # 1% chance of suspicious order
+    # Pick customers, employees and shippers for all orders at once
+    order_customers = [customers[i] for i in rng.integers(len(customers), size=n)]
+    order_employees = [employees[i] for i in rng.integers(len(employees), size=n)]
+    order_shippers = [shippers[i] for i in rng.integers(len(shippers), size=n)]
 
-        if is_suspicious:
-            status = 'Pending'
-            payment_method = 'Gift Card'
-            shipping_method = random.choice(['Expedited', 'International'])
-        else:
-            status = random.choices(statuses, weights=status_weights)[0]
-            payment_method = random.choices(payment_methods, weights=payment_weights)[0]
-            shipping_method = random.choices(
-                shipping_methods, weights=shipping_weights
-            )[0]
-
-        # Calculate tax based on order value and region
-        base_tax_rate = 0.08  # 8% base tax rate
-        customer = random.choice(customers)
-        # Adjust tax rate based on region
-        tax_multipliers = {
-            'North America': 1,
-            'Europe': 1.2,
-            'Asia': 0.9,
-            'South America': 0.85,
-            'Africa': 0.8,
-        }
-        tax_rate = base_tax_rate * tax_multipliers[customer.region]
-        tax = round(random.uniform(5, 50) * tax_rate, 2)  # Simplified calculation
-
-        order = Order(
-            order_date=order_date,
-            status=status,
-            shipping_method=shipping_method,
-            payment_method=payment_method,
-            discount=round(discount, 2),
-            tax=tax,
-            customer=customer,
-            employee=random.choice(employees),
-            shipper=random.choice(shippers),
+    # Calculate tax based on order value and customer region (simplified)
+    tax_rates = base_tax_rate * np.array(
+        [tax_multipliers[customer.region] for customer in order_customers]
+    )
+    taxes = np.round(rng.uniform(5, 50, n) * tax_rates, 2)
+
+    order_columns = (
+        'order_date',
+        'status',
+        'shipping_method',
+        'payment_method',
+        'discount',
+        'tax',
+        'customer_id',
+        'employee_id',
+        'shipper_id',
+    )
+    orders = [
+        (
+            order_dates[i].isoformat(),
+            order_statuses[i],
+            str(order_shipping_methods[i]),
+            order_payment_methods[i],
+            float(discounts[i]),
+            float(taxes[i]),
+            order_customers[i].id,
+            order_employees[i].id,
+            order_shippers[i].id,
         )
-        session.add(order)
-    session.commit()
+        for i in range(n)
+    ]
+
+    # Bulk-load all orders in a single executemany
+    bulk_copy(session, Order.__table__, order_columns, orders)
 
 
 @measure_duration
@@ -1210,9 +1565,11 @@ def generate_order_items(session, n=30000):
     """
     logging.info(f"Generating {n} order items...")
 
-    # Fetch all required data upfront
+    # Fetch all required data upfront, eager-loading categories and indexing
+    # price history so per-book lookups don't query the database
     orders = session.query(Order).all()
-    books = session.query(Book).all()
+    books = session.query(Book).options(selectinload(Book.categories)).all()
+    price_index = load_price_index(session)
 
     # Pre-calculate book categories for faster lookup
     book_categories = {book.id: [cat.name for cat in book.categories] for book in books}
@@ -1225,8 +1582,19 @@ def generate_order_items(session, n=30000):
         'Children Set': ['Picture Books', 'Middle Grade'],
     }
 
+    # Pre-calculate the pool of candidate books for each bundle type
+    bundle_book_pools = {
+        bundle_type: [
+            b for b in books if not set(book_categories[b.id]).isdisjoint(categories)
+        ]
+        for bundle_type, categories in bundle_patterns.items()
+    }
+    bundle_types = list(bundle_book_pools)
+
     # Track books per order for realistic distribution
     books_per_order = {}
+    # Order items are buffered as tuples in order_item_columns order
+    order_item_columns = ('order_id', 'book_id', 'quantity', 'unit_price')
     order_items = []
     batch_size = 1000
 
@@ -1244,15 +1612,10 @@ def generate_order_items(session, n=30000):
 
         if create_bundle:
             # Select bundle type based on category
-            bundle_type = random.choice(list(bundle_patterns.keys()))
-            relevant_categories = bundle_patterns[bundle_type]
-
-            # Get books from relevant categories using pre-calculated categories
-            bundle_books = [
-                b
-                for b in books
-                if any(cat in relevant_categories for cat in book_categories[b.id])
-            ]
+            bundle_type = random.choice(bundle_types)
+
+            # Get books from relevant categories using the pre-calculated pools
+            bundle_books = bundle_book_pools[bundle_type]
 
             # Select 3-5 books for the bundle
             bundle_size = random.randint(3, 5)
@@ -1261,17 +1624,12 @@ def generate_order_items(session, n=30000):
                 bundle_discount = 0.2  # 20% discount for bundles
 
                 for book in bundle_items:
-                    # Use the get_price_at_date method
-                    base_price = book.get_price_at_date(session, order.order_date)
+                    # Look up the historical price in the preloaded price index
+                    base_price = price_at_date(price_index, book, order.order_date)
                     discounted_price = base_price * (1 - bundle_discount)
 
                     order_items.append(
-                        {
-                            'order_id': order.id,
-                            'book_id': book.id,
-                            'quantity': 1,
-                            'unit_price': round(discounted_price, 2),
-                        }
+                        (order.id, book.id, 1, round(discounted_price, 2))
                     )
                     books_per_order[order.id] += 1
 
@@ -1287,7 +1645,7 @@ def generate_order_items(session, n=30000):
                 quantity = 1 if random.random() < 0.8 else random.randint(2, 3)
 
             # Get historical price
-            unit_price = book.get_price_at_date(session, order.order_date)
+            unit_price = price_at_date(price_index, book, order.order_date)
 
             # Apply discounts
             if quantity > 2:
@@ -1295,39 +1653,30 @@ def generate_order_items(session, n=30000):
             if book.stock_level > book.safety_stock * 2:
                 unit_price *= 0.95  # 5% discount for overstocked items
 
-            order_items.append(
-                {
-                    'order_id': order.id,
-                    'book_id': book.id,
-                    'quantity': quantity,
-                    'unit_price': round(unit_price, 2),
-                }
-            )
+            order_items.append((order.id, book.id, quantity, round(unit_price, 2)))
             books_per_order[order.id] += 1
 
         # Batch insert when we reach batch_size
         if len(order_items) >= batch_size:
-            session.execute(OrderItem.__table__.insert(), order_items)
-            session.commit()
+            bulk_copy(session, OrderItem.__table__, order_item_columns, order_items)
             order_items = []
 
     # Insert any remaining items
-    if order_items:
-        session.execute(OrderItem.__table__.insert(), order_items)
-        session.commit()
+    bulk_copy(session, OrderItem.__table__, order_item_columns, order_items)
 
 
 @measure_duration
-def generate_customer_service_interactions(session, n=2000):
+def generate_customer_service_interactions(session, n=2000, executor=None):
     """Generate a specified number of customer service interaction records
        with realistic scenarios.
 
     Args:
         session: SQLAlchemy session object for database interactions.
         n (int): Number of customer service interactions to generate.
+        executor: Optional process pool for Faker columns (see faker_executor).
     """
     logging.info(f"Generating {n} customer service interactions...")
-    customers = session.query(Customer).all()
+    customers = session.query(Customer).options(selectinload(Customer.orders)).all()
     cs_employees = (
         session.query(Employee)
         .filter(
@@ -1448,12 +1797,27 @@ def generate_customer_service_interactions(session, n=2000):
         "website functionality",
     ]
 
-    for _ in range(n):
+    # Free-form notes for untemplated interaction types are drawn from a
+    # small prebuilt pool instead of calling Faker per row
+    (sentence_pool,) = fake_columns(min(n, 500), 'sentence', executor=executor)
+
+    # Draw interaction types, statuses and channels for all interactions at once
+    interaction_type_arr = batch_choice(
+        list(interaction_types.keys()),
+        [t['weight'] for t in interaction_types.values()],
+        n,
+    )
+    status_arr = batch_choice(
+        list(status_progression.keys()), list(status_progression.values()), n
+    )
+    channel_arr = batch_choice(list(channels.keys()), list(channels.values()), n)
+
+    today = datetime.now().date()
+
+    interactions = []
+    for i in range(n):
         # Select interaction type based on weights
-        interaction_type = random.choices(
-            list(interaction_types.keys()),
-            weights=[t['weight'] for t in interaction_types.values()],
-        )[0]
+        interaction_type = interaction_type_arr[i]
         type_info = interaction_types[interaction_type]
 
         # Select customer and potentially related order
@@ -1467,16 +1831,17 @@ def generate_customer_service_interactions(session, n=2000):
         else:
             # For non-order interactions, use customer's account creation date
             min_date = customer.account_creation_date
-            max_date = datetime.now().date()
+            max_date = today
 
-        interaction_date = fake.date_between(start_date=min_date, end_date=max_date)
+        # Uniform date between min_date and max_date (inclusive)
+        interaction_date = min_date + timedelta(
+            days=random.randint(0, (max_date - min_date).days)
+        )
 
         # Calculate resolution date based on type
         min_days, max_days = type_info['resolution_days']
         resolution_date = None
-        status = random.choices(
-            list(status_progression.keys()), weights=list(status_progression.values())
-        )[0]
+        status = status_arr[i]
 
         if status in ['Resolved', 'Closed']:
             resolution_date = interaction_date + timedelta(
@@ -1505,30 +1870,27 @@ def generate_customer_service_interactions(session, n=2000):
             else:
                 notes = note_template.format(order_id=order.id if order else 'N/A')
         else:
-            notes = fake.sentence()
-
-        interaction = CustomerServiceInteraction(
-            customer=customer,
-            order=order,
-            interaction_date=interaction_date,
-            interaction_type=interaction_type,
-            channel=random.choices(
-                list(channels.keys()), weights=list(channels.values())
-            )[0],
-            priority=type_info['typical_priority'],
-            status=status,
-            resolution_date=resolution_date,
-            satisfaction_score=satisfaction_score,
-            notes=notes,
-            employee=random.choice(cs_employees) if cs_employees else None,
+            notes = random.choice(sentence_pool)
+
+        employee = random.choice(cs_employees) if cs_employees else None
+        interactions.append(
+            dict(
+                customer_id=customer.id,
+                order_id=order.id if order else None,
+                interaction_date=interaction_date,
+                interaction_type=interaction_type,
+                channel=channel_arr[i],
+                priority=type_info['typical_priority'],
+                status=status,
+                resolution_date=resolution_date,
+                satisfaction_score=satisfaction_score,
+                notes=notes,
+                employee_id=employee.id if employee else None,
+            )
         )
-        session.add(interaction)
 
-        # Batch commits
-        if _ % 100 == 0:
-            session.commit()
-
-    session.commit()
+    # Insert all interactions with a single executemany
+    session.execute(CustomerServiceInteraction.__table__.insert(), interactions)
 
 
 @measure_duration
@@ -1546,19 +1908,27 @@ def generate_cross_functional_data(session):
     logging.info("Generating cross-functional data relationships...")
 
     # Get existing data
-    orders = session.query(Order).all()
-    customers = session.query(Customer).all()
-    books = session.query(Book).all()
+    orders = (
+        session.query(Order)
+        .options(selectinload(Order.order_items))
+        .yield_per(STREAM_BATCH_SIZE)
+    )
+    customers = session.query(Customer).yield_per(STREAM_BATCH_SIZE)
+    books = session.query(Book).options(selectinload(Book.categories)).all()
+
+    # Aggregate units sold per book and spend per customer in a single pass
+    # over all order items
+    sales_by_book = defaultdict(int)
+    spend_by_customer = defaultdict(float)
+    for order in orders:
+        for item in order.order_items:
+            sales_by_book[item.book_id] += item.quantity
+            spend_by_customer[order.customer_id] += item.quantity * item.unit_price
 
     # Update category popularity based on book sales
     category_popularity = {}
     for book in books:
-        sales = sum(
-            item.quantity
-            for order in orders
-            for item in order.order_items
-            if item.book_id == book.id
-        )
+        sales = sales_by_book[book.id]
         # Update popularity for all categories of the book
         for category in book.categories:
             category_popularity[category.id] = (
@@ -1575,11 +1945,7 @@ def generate_cross_functional_data(session):
 
     # Update customer CLV based on actual order history
     for customer in customers:
-        total_spent = sum(
-            item.quantity * item.unit_price
-            for order in customer.orders
-            for item in order.order_items
-        )
+        total_spent = spend_by_customer[customer.id]
         # Adjust CLV based on actual spending
         customer.clv = round(
             total_spent * 1.2, 2
@@ -1597,12 +1963,7 @@ def generate_cross_functional_data(session):
             }
 
         # Calculate metrics
-        sales = sum(
-            item.quantity
-            for order in orders
-            for item in order.order_items
-            if item.book_id == book.id
-        )
+        sales = sales_by_book[book.id]
         supplier_metrics[supplier_id]['total_sales'] += sales
         supplier_metrics[supplier_id]['total_revenue'] += sales * book.price
         if book.stock_level < book.safety_stock:
@@ -1621,8 +1982,6 @@ def generate_cross_functional_data(session):
             )  # Lower score for stock outs
             supplier.rating = round((sales_score + stock_score) / 2, 2)
 
-    session.commit()
-
 
 @measure_step("Simulating customer churn patterns")
 def simulate_customer_churn(session):
@@ -1635,10 +1994,15 @@ def simulate_customer_churn(session):
         session: SQLAlchemy session object for database interactions.
     """
     # Get existing data
-    customers = session.query(Customer).all()
+    customers = (
+        session.query(Customer)
+        .options(selectinload(Customer.orders))
+        .yield_per(STREAM_BATCH_SIZE)
+    )
 
     current_date = datetime.now().date()
 
+    retention_interactions = []
     for customer in customers:
         if customer.orders:
             last_order = max(customer.orders, key=lambda x: x.order_date)
@@ -1650,16 +2014,22 @@ def simulate_customer_churn(session):
 
                 # Create retention attempt interaction
                 if random.random() < 0.7:  # 70% chance of retention attempt
-                    interaction = CustomerServiceInteraction(
-                        customer=customer,
-                        order=last_order,
-                        interaction_date=current_date
-                        - timedelta(days=random.randint(1, 30)),
-                        interaction_type='Retention',
-                        notes="Customer identified as at-risk for churn. "
-                        "Retention offer made.",
+                    retention_interactions.append(
+                        dict(
+                            customer_id=customer.id,
+                            order_id=last_order.id,
+                            interaction_date=current_date
+                            - timedelta(days=random.randint(1, 30)),
+                            interaction_type='Retention',
+                            notes="Customer identified as at-risk for churn. "
+                            "Retention offer made.",
+                        )
                     )
-                    session.add(interaction)
+
+    if retention_interactions:
+        session.execute(
+            CustomerServiceInteraction.__table__.insert(), retention_interactions
+        )
 
 
 @measure_step("Simulating inventory management scenarios")
@@ -1675,18 +2045,20 @@ def simulate_inventory(session):
     """
     # Get existing data
     books = session.query(Book).all()
-    orders = session.query(Order).all()
 
-    # Pre-calculate order counts for each book
-    order_counts = {book.id: 0 for book in books}
-    for order in orders:
-        for item in order.order_items:
-            order_counts[item.book_id] += item.quantity
+    # Sum units ordered per book in the database instead of loading items
+    order_counts = dict(
+        session.execute(
+            select(OrderItem.book_id, func.sum(OrderItem.quantity)).group_by(
+                OrderItem.book_id
+            )
+        ).all()
+    )
 
     for book in books:
         # Simulate stockouts for popular items
         if book.format != 'E-book':
-            order_count = order_counts[book.id]
+            order_count = order_counts.get(book.id, 0)
             if order_count > 50:  # Popular book
                 if random.random() < 0.2:  # 20% chance of stockout
                     book.stock_level = 0
@@ -1694,11 +2066,9 @@ def simulate_inventory(session):
                         1.2  # Increase reorder point for frequently stocked-out items
                     )
 
-    session.commit()
-
 
 @measure_step("Simulating promotional impacts")
-def simulate_promotions(session):
+def simulate_promotions(session, orders):
     """Simulate promotional impacts to create realistic patterns in the data.
 
     Adjusts discounts during defined promotion periods and annotates orders
@@ -1706,10 +2076,8 @@ def simulate_promotions(session):
 
     Args:
         session: SQLAlchemy session object for database interactions.
+        orders (list): All orders, shared with simulate_fraud.
     """
-    # Get existing data
-    orders = session.query(Order).all()
-
     current_date = datetime.now().date()
 
     # 1. Promotional Impact Simulation
@@ -1750,19 +2118,18 @@ def simulate_promotions(session):
 
 
 @measure_step("Simulating fraud patterns")
-def simulate_fraud(session):
+def simulate_fraud(session, orders):
     """Simulate fraud patterns to create realistic patterns in the data.
 
     Flags orders with suspicious patterns and annotates them for review.
 
     Args:
         session: SQLAlchemy session object for database interactions.
+        orders (list): All orders with their order items loaded.
     """
-    # Get existing data
-    orders = session.query(Order).all()
-
     # Pre-calculate order values and counts for each customer
     customer_order_data = {}
+    order_values = {}
     for order in orders:
         if order.customer_id not in customer_order_data:
             customer_order_data[order.customer_id] = {
@@ -1771,52 +2138,54 @@ def simulate_fraud(session):
                 'orders': [],
             }
         order_value = sum(item.quantity * item.unit_price for item in order.order_items)
+        order_values[order.id] = order_value
         customer_order_data[order.customer_id]['order_count'] += 1
         customer_order_data[order.customer_id]['total_value'] += order_value
         customer_order_data[order.customer_id]['orders'].append(order)
 
     # Detect suspicious patterns
     for customer_id, data in customer_order_data.items():
-        # Pattern 1: Multiple orders in short timeframe
-        for order in data['orders']:
-            same_day_orders = [
-                o
-                for o in data['orders']
-                if abs((o.order_date - order.order_date).days) < 1
-            ]
-            if len(same_day_orders) > 3:
-                for o in same_day_orders:
+        # Pattern 1: Multiple orders in short timeframe, found by sweeping a
+        # window over the customer's orders sorted by date
+        customer_orders = sorted(data['orders'], key=lambda o: o.order_date)
+        start = 0
+        for end in range(1, len(customer_orders) + 1):
+            if (
+                end < len(customer_orders)
+                and (
+                    customer_orders[end].order_date
+                    - customer_orders[start].order_date
+                ).days
+                < 1
+            ):
+                continue
+            # customer_orders[start:end] were all placed on the same day
+            if end - start > 3:
+                for o in customer_orders[start:end]:
                     o.status = 'Pending Review'
                     o.notes = (
                         o.notes or ''
                     ) + ' [Flagged for review - multiple orders]'
+            start = end
 
         # Pattern 2: Unusually high value orders
         for order in data['orders']:
-            order_value = sum(
-                item.quantity * item.unit_price for item in order.order_items
-            )
-            if order_value > 1000:  # High value threshold
+            if order_values[order.id] > 1000:  # High value threshold
                 order.status = 'Pending Review'
                 order.notes = (order.notes or '') + ' [Flagged for review - high value]'
 
         # Pattern 3: Unusual shipping patterns
         for order in data['orders']:
-            order_value = sum(
-                item.quantity * item.unit_price for item in order.order_items
-            )
             if (
                 order.shipping_method == 'Expedited'
                 and order.payment_method == 'Gift Card'
-                and order_value > 500
+                and order_values[order.id] > 500
             ):
                 order.status = 'Pending Review'
                 order.notes = (
                     order.notes or ''
                 ) + ' [Flagged for review - unusual shipping]'
 
-    session.commit()
-
 
 @measure_step("Simulating dynamic pricing")
 def simulate_pricing(session):
@@ -1829,28 +2198,52 @@ def simulate_pricing(session):
     """
 
     # Get existing data
-    books = session.query(Book).all()
-    orders = session.query(Order).all()
+    book_ids = session.scalars(select(Book.id)).all()
 
-    # Pre-calculate order counts for each book
-    order_counts = {book.id: 0 for book in books}
-    for order in orders:
-        for item in order.order_items:
-            order_counts[item.book_id] += item.quantity
+    # Sum units ordered per book in the database instead of loading items
+    order_counts = dict(
+        session.execute(
+            select(OrderItem.book_id, func.sum(OrderItem.quantity)).group_by(
+                OrderItem.book_id
+            )
+        ).all()
+    )
 
-    for book in books:
-        # Adjust prices based on demand (order frequency)
-        order_count = order_counts[book.id]
+    # Adjust prices based on demand (order frequency) and on simulated
+    # competition; the factors are decided here and applied in SQL
+    high_demand_ids = []
+    low_demand_ids = []
+    competitive_factors = []
+    for book_id in book_ids:
+        order_count = order_counts.get(book_id, 0)
         if order_count > 100:  # High demand
-            book.price *= 1.1  # 10% price increase
+            high_demand_ids.append(book_id)
         elif order_count < 10:  # Low demand
-            book.price *= 0.9  # 10% price decrease
+            low_demand_ids.append(book_id)
 
-        # Adjust prices based on competition (simulated)
         if random.random() < 0.1:  # 10% chance of competitive pressure
-            book.price *= random.uniform(0.85, 0.95)
+            competitive_factors.append(
+                {'book_id': book_id, 'factor': random.uniform(0.85, 0.95)}
+            )
 
-    session.commit()
+    book_table = Book.__table__
+    for ids, factor in (
+        (high_demand_ids, 1.1),  # 10% price increase
+        (low_demand_ids, 0.9),  # 10% price decrease
+    ):
+        if ids:
+            session.execute(
+                book_table.update()
+                .where(book_table.c.id.in_(ids))
+                .values(price=book_table.c.price * factor)
+            )
+    if competitive_factors:
+        session.execute(
+            book_table.update()
+            .where(book_table.c.id == bindparam('book_id'))
+            .values(price=book_table.c.price * bindparam('factor')),
+            competitive_factors,
+        )
 
 
 @measure_duration
@@ -1863,14 +2256,16 @@ def simulate_business_scenarios(session):
     """
     logging.info("Simulating business scenarios...")
 
+    # Promotions and fraud both walk every order; load them (and the items
+    # fraud sums) once and share the list
+    orders = session.query(Order).options(selectinload(Order.order_items)).all()
+
     simulate_customer_churn(session)
     simulate_inventory(session)
-    simulate_promotions(session)
-    simulate_fraud(session)
+    simulate_promotions(session, orders)
+    simulate_fraud(session, orders)
     simulate_pricing(session)
 
-    session.commit()
-
 
 @measure_duration
 def introduce_data_anomalies(session):
@@ -1882,64 +2277,131 @@ def introduce_data_anomalies(session):
     """
     logging.info("Introducing data anomalies and exceptions...")
 
-    customers = session.query(Customer).all()
-    orders = session.query(Order).all()
-    books = session.query(Book).all()
+    today = datetime.now().date()
+
+    # Write out pending simulation changes so the reads below see them
+    session.flush()
+
+    # Anomalies are chosen by id; only the few rows whose values are copied or
+    # transformed are fetched, and only the columns they need
+    customer_ids = session.scalars(select(Customer.id)).all()
+    order_ids = session.scalars(select(Order.id)).all()
+    books = session.execute(select(Book.id, Book.price)).all()
+
+    # Anomalies draw their per-row choices as NumPy arrays up front; book and
+    # order anomalies sample their rows independently, without replacement
+    def sample_indexes(population, fraction):
+        size = int(len(population) * fraction)
+        return rng.choice(len(population), size, replace=False)
+
+    # The customer anomalies take disjoint slices of one shuffled order, so no
+    # customer receives more than one of them
+    n_customers = len(customer_ids)
+    n_nullify = int(n_customers * 0.05)
+    n_duplicate = int(n_customers * 0.01)
+    n_typo = int(n_customers * 0.02)
+    n_phone = int(n_customers * 0.03)
+    nullify_indexes, duplicate_indexes, typo_indexes, phone_indexes, _ = np.split(
+        rng.permutation(n_customers),
+        np.cumsum([n_nullify, n_duplicate, n_typo, n_phone]),
+    )
 
     # 1. Incomplete Customer Data (5% of customers)
     logging.info("Adding incomplete customer records...")
-    for customer in random.sample(customers, int(len(customers) * 0.05)):
-        field_to_nullify = random.choice(['email', 'phone', 'address'])
-        setattr(customer, field_to_nullify, None)
+    nullable_fields = ['email', 'phone', 'address']
+    nullify_field_codes = rng.integers(len(nullable_fields), size=len(nullify_indexes))
+    nullify_mappings = []
+    data_quality_interactions = []
+    for i, field_code in zip(nullify_indexes, nullify_field_codes):
+        customer_id = customer_ids[i]
+        field_to_nullify = nullable_fields[field_code]
+        nullify_mappings.append({'id': customer_id, field_to_nullify: None})
 
         # Add note about incomplete data
-        customer_interaction = CustomerServiceInteraction(
-            customer=customer,
-            interaction_date=datetime.now().date(),
-            interaction_type='Data Quality Issue',
-            notes=f"Missing {field_to_nullify} information",
+        data_quality_interactions.append(
+            dict(
+                customer_id=customer_id,
+                interaction_date=today,
+                interaction_type='Data Quality Issue',
+                notes=f"Missing {field_to_nullify} information",
+            )
+        )
+    if data_quality_interactions:
+        session.execute(
+            CustomerServiceInteraction.__table__.insert(), data_quality_interactions
         )
-        session.add(customer_interaction)
+
+    # Nullify all selected fields in one ORM bulk UPDATE by primary key
+    session.execute(
+        update(Customer),
+        nullify_mappings,
+        execution_options={'synchronize_session': False},
+    )
 
     # 2. Duplicate Customer Records (1% of customers)
     logging.info("Creating duplicate customer records...")
-    for customer in random.sample(customers, int(len(customers) * 0.01)):
-        duplicate = Customer(
-            name=customer.name,
-            email=customer.email,
-            phone=customer.phone,
-            address=customer.address,
-            segment=customer.segment,
-            region=customer.region,
-            age=customer.age,
-            gender=customer.gender,
-            income_level=customer.income_level,
-            clv=customer.clv,
-            account_creation_date=customer.account_creation_date,
-            preferred_contact_method=customer.preferred_contact_method,
+    # Duplicates copy the contact and profile fields only; purchase behaviour
+    # columns are left empty on the copy
+    customer_table = Customer.__table__
+    duplicate_columns = [
+        customer_table.c[name]
+        for name in (
+            'name',
+            'email',
+            'phone',
+            'address',
+            'segment',
+            'region',
+            'age',
+            'gender',
+            'income_level',
+            'clv',
+            'account_creation_date',
+            'preferred_contact_method',
         )
-        session.add(duplicate)
+    ]
+    duplicates = [
+        dict(row)
+        for row in session.execute(
+            select(*duplicate_columns).where(
+                customer_table.c.id.in_([customer_ids[i] for i in duplicate_indexes])
+            )
+        ).mappings()
+    ]
+    if duplicates:
+        session.execute(Customer.__table__.insert(), duplicates)
 
     # 3. Typos in customer names (2% of customers)
     logging.info("Introducing typos in customer names...")
-    typo_patterns = {
-        'replace_vowel': lambda s: s.replace('a', '@', 1).replace('i', '1', 1),
-        'add_numbers': lambda s: s + '123',
-        'add_special': lambda s: s + '!!',
-        'uppercase': lambda s: s.upper(),
-        'lowercase': lambda s: s.lower(),
-    }
-
-    for customer in random.sample(customers, int(len(customers) * 0.02)):
-        pattern_name = random.choice(list(typo_patterns.keys()))
-        customer.name = typo_patterns[pattern_name](customer.name)
+    typo_functions = (
+        lambda s: s.replace('a', '@', 1).replace('i', '1', 1),  # replace vowel
+        lambda s: s + '123',  # add numbers
+        lambda s: s + '!!',  # add special characters
+        str.upper,
+        str.lower,
+    )
+    typo_codes = rng.integers(len(typo_functions), size=len(typo_indexes))
+    typo_customer_ids = [customer_ids[i] for i in typo_indexes]
+    names = dict(
+        session.execute(
+            select(Customer.id, Customer.name).where(
+                Customer.id.in_(typo_customer_ids)
+            )
+        ).all()
+    )
+    typo_mappings = [
+        {'id': customer_id, 'name': typo_functions[code](names[customer_id])}
+        for customer_id, code in zip(typo_customer_ids, typo_codes)
+    ]
+    session.execute(
+        update(Customer),
+        typo_mappings,
+        execution_options={'synchronize_session': False},
+    )
 
     # 4. Inconsistent phone number formats (3% of customers)
     logging.info("Creating inconsistent phone formats...")
 
-    def generate_phone(pattern):
-        return ''.join(str(random.randint(0, 9)) if c == 'X' else c for c in pattern)
-
     phone_formats = [
         '(XXX) XXX-XXXX',
         'XXX.XXX.XXXX',
@@ -1947,47 +2409,104 @@ def introduce_data_anomalies(session):
         'XXXXXXXXXX',
         '+1XXXXXXXXXX',
     ]
-
-    for customer in random.sample(customers, int(len(customers) * 0.03)):
-        pattern = random.choice(phone_formats)
-        customer.phone = generate_phone(pattern)
+    # Each format as a str.format template with one field per digit
+    phone_templates = [pattern.replace('X', '{}') for pattern in phone_formats]
+    phone_digit_counts = np.array([pattern.count('X') for pattern in phone_formats])
+
+    phone_codes = rng.integers(len(phone_formats), size=len(phone_indexes))
+    # Draw the digits for all phone numbers at once and slice them per number
+    digit_counts = phone_digit_counts[phone_codes]
+    digit_ends = np.cumsum(digit_counts)
+    digits = rng.integers(0, 10, size=int(digit_counts.sum())).tolist()
+    phone_mappings = [
+        {
+            'id': customer_ids[i],
+            'phone': phone_templates[code].format(*digits[start:end]),
+        }
+        for i, code, start, end in zip(
+            phone_indexes, phone_codes, digit_ends - digit_counts, digit_ends
+        )
+    ]
+    session.execute(
+        update(Customer),
+        phone_mappings,
+        execution_options={'synchronize_session': False},
+    )
 
     # 5. Outlier Values
     logging.info("Introducing outlier values...")
 
-    # Extreme prices (0.5% of books)
-    for book in random.sample(books, int(len(books) * 0.005)):
-        if random.random() < 0.5:
-            # Extremely high price
-            book.price *= 100
-        else:
-            # Extremely low price (pricing error)
-            book.price = 0.01
-
-    # Unusual order quantities (0.5% of orders)
-    for order in random.sample(orders, int(len(orders) * 0.005)):
-        if order.order_items:
-            item = random.choice(order.order_items)
-            item.quantity = random.randint(1000, 5000)
+    # Extreme prices (0.5% of books): half extremely high, half extremely low
+    # (pricing error)
+    price_indexes = sample_indexes(books, 0.005)
+    high_price_mask = rng.random(len(price_indexes)) < 0.5
+    price_mappings = [
+        {
+            'id': books[i].id,
+            'price': books[i].price * 100 if high_price else 0.01,
+        }
+        for i, high_price in zip(price_indexes, high_price_mask)
+    ]
+    if price_mappings:
+        session.execute(update(Book), price_mappings)
+
+    # Unusual order quantities on one item of 0.5% of orders
+    quantity_indexes = sample_indexes(order_ids, 0.005)
+    outlier_quantities = rng.integers(1000, 5001, size=len(quantity_indexes))
+    quantity_order_ids = [order_ids[i] for i in quantity_indexes]
+    item_ids_by_order = defaultdict(list)
+    for item_id, order_id in session.execute(
+        select(OrderItem.id, OrderItem.order_id).where(
+            OrderItem.order_id.in_(quantity_order_ids)
+        )
+    ):
+        item_ids_by_order[order_id].append(item_id)
+    quantity_mappings = [
+        {'id': random.choice(item_ids_by_order[order_id]), 'quantity': int(quantity)}
+        for order_id, quantity in zip(quantity_order_ids, outlier_quantities)
+        if order_id in item_ids_by_order
+    ]
+    session.execute(
+        update(OrderItem),
+        quantity_mappings,
+        execution_options={'synchronize_session': False},
+    )
 
     # 6. Inconsistent Dates
     logging.info("Introducing date inconsistencies...")
 
-    # Future dates (0.1% of orders)
-    future_dates = [
-        datetime.now().date() + timedelta(days=random.randint(1, 365))
-        for _ in range(int(len(orders) * 0.001))
+    # Future dates (0.1% of orders), 1-365 days ahead, in one bulk UPDATE
+    future_indexes = sample_indexes(order_ids, 0.001)
+    future_dates = np.datetime64(today) + rng.integers(
+        1, 366, size=len(future_indexes)
+    )
+    future_date_mappings = [
+        {'id': order_ids[i], 'order_date': future_date}
+        for i, future_date in zip(future_indexes, future_dates.astype(object))
     ]
+    session.execute(
+        update(Order),
+        future_date_mappings,
+        execution_options={'synchronize_session': False},
+    )
 
-    for order, future_date in zip(
-        random.sample(orders, len(future_dates)), future_dates
-    ):
-        order.order_date = future_date
-
-    session.commit()
     logging.info("Data anomalies introduction complete.")
 
 
+@measure_duration
+def compact_database():
+    """Rebuild the database file and refresh query planner statistics.
+
+    The simulation and anomaly steps update and delete rows after the bulk
+    load, so VACUUM repacks the pages and ANALYZE records index statistics
+    for the text-to-SQL queries run against the finished database.
+    """
+    logging.info("Compacting database...")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM")
+        conn.exec_driver_sql("ANALYZE")
+
+
 @measure_duration
 def generate_data():
     """Main function to orchestrate the data generation process.
@@ -2010,6 +2529,7 @@ def generate_data():
         11. Generate cross-functional data
         12. Simulate business scenarios
         13. Introduce data anomalies
+        14. Compact the database
 
     """
     logging.basicConfig(
@@ -2021,27 +2541,40 @@ def generate_data():
     logging.info("Starting data generation...")
     logging.info("═" * 40)
 
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    # Bulk-load session: no autoflush before queries and no attribute expiry on
+    # commit, so loaded objects are reused without re-SELECTs. The whole
+    # pipeline runs in one transaction that commits once at the end (or rolls
+    # back on error); generators flush before querying rows they just added
+    # through the ORM.
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    # One Faker worker pool serves every generator (None on a single CPU)
+    executor = faker_executor()
     try:
-        generate_customers(session, n=1000)
-        generate_employees(session, n=50)
-        generate_suppliers(session, n=100)
-        generate_categories(session, n=20)
-        generate_authors(session, n=500)
-        generate_books(session, n=5000)
-        generate_shippers(session, n=10)
-        generate_orders(session, n=10000)
-        generate_order_items(session, n=30000)
-        generate_customer_service_interactions(session, n=2000)
-        generate_cross_functional_data(session)
-        simulate_business_scenarios(session)
-        introduce_data_anomalies(session)
-
-        logging.info("Data generation completed successfully")
-        logging.info("═" * 40)
+        with Session.begin() as session:
+            generate_customers(session, n=1000, executor=executor)
+            generate_employees(session, n=50, executor=executor)
+            generate_suppliers(session, n=100, executor=executor)
+            generate_categories(session, n=20)
+            generate_authors(session, n=500, executor=executor)
+            generate_books(session, n=5000, executor=executor)
+            generate_shippers(session, n=10, executor=executor)
+            generate_orders(session, n=10000)
+            generate_order_items(session, n=30000)
+            generate_customer_service_interactions(
+                session, n=2000, executor=executor
+            )
+            generate_cross_functional_data(session)
+            simulate_business_scenarios(session)
+            introduce_data_anomalies(session)
     finally:
-        session.close()
+        if executor is not None:
+            executor.shutdown()
+
+    # VACUUM needs the generation transaction to be committed
+    compact_database()
+
+    logging.info("Data generation completed successfully")
+    logging.info("═" * 40)
 
 
 # ---------------------
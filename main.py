@@ -9,4 +9,6 @@ import uvicorn
 
 
 if __name__ == "__main__":
+    # loop/http default to "auto", which picks uvloop and httptools when they are
+    # installed (uvicorn[standard]) and falls back to asyncio/h11 otherwise
     uvicorn.run("api:app", host="127.0.0.1", port=8080, reload=True, use_colors=True)
@@ -1,25 +1,68 @@
-from typing import Dict, List, Tuple
+import json
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Tuple
 
 
 class SessionManager:
     """
-    Manages session message history. Uses in-memory storage.
-    In production, we recommend using Redis or another persistent storage.
+    Manages session message history. Uses in-memory storage, keeping only
+    the most recent max_messages messages of each chat.
+    In production, we recommend using Redis or another persistent storage
+    (see RedisSessionManager).
     """
 
-    def __init__(self):
-        self.sessions: Dict[str, List[Tuple[str, bool]]] = {}
+    def __init__(self, max_messages: int = 200):
+        self.sessions: Dict[str, Deque[Tuple[str, bool]]] = defaultdict(
+            lambda: deque(maxlen=max_messages)
+        )
 
-    def get_history(self, chat_id: str) -> List[Tuple[str, bool]]:
+    async def get_history(self, chat_id: str) -> List[Tuple[str, bool]]:
         """
         Retrieves the message history for a given chat.
         """
-        return [tuple(msg) for msg in self.sessions.get(chat_id, [])]
+        return list(self.sessions.get(chat_id, ()))
 
-    def add_message(self, chat_id: str, message: Tuple[str, bool]) -> None:
+    async def add_message(self, chat_id: str, message: Tuple[str, bool]) -> None:
         """
         Adds a message to the session history.
         """
-        if chat_id not in self.sessions:
-            self.sessions[chat_id] = []
         self.sessions[chat_id].append(message)
+
+
+class RedisSessionManager:
+    """
+    Manages session message history in Redis, so that sessions are shared
+    between server workers and survive restarts. Each session is a Redis list
+    of JSON-encoded messages that expires after a period of inactivity and,
+    like SessionManager, keeps only the most recent max_messages messages.
+    """
+
+    def __init__(self, url: str, ttl: int = 24 * 60 * 60, max_messages: int = 200):
+        import redis.asyncio as redis
+
+        self.redis = redis.from_url(url)
+        self.ttl = ttl
+        self.max_messages = max_messages
+
+    @staticmethod
+    def _key(chat_id: str) -> str:
+        return f"session:{chat_id}:messages"
+
+    async def get_history(self, chat_id: str) -> List[Tuple[str, bool]]:
+        """
+        Retrieves the message history for a given chat.
+        """
+        messages = await self.redis.lrange(self._key(chat_id), 0, -1)
+        return [tuple(json.loads(msg)) for msg in messages]
+
+    async def add_message(self, chat_id: str, message: Tuple[str, bool]) -> None:
+        """
+        Adds a message to the session history, trims it to the most recent
+        max_messages messages and refreshes its expiry.
+        """
+        key = self._key(chat_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, json.dumps(message))
+            pipe.ltrim(key, -self.max_messages, -1)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
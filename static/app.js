@@ -4,8 +4,9 @@ const { useState, useEffect, useRef, useCallback } = React;
 
 // API Service for handling chat-related requests
 const apiService = {
-    async sendChatMessage(message, session_id) {
-        const response = await fetch('/api/chat', {
+    // Streams the response to a chat message, calling onText with each new piece of text
+    async streamChatMessage(message, session_id, onText) {
+        const response = await fetch('/api/chat-stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -13,7 +14,23 @@ const apiService = {
             body: JSON.stringify({ message, session_id }),
         });
         if (!response.ok) throw new Error('Failed to get response from API');
-        return response.json();
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            // Server-Sent Events are separated by a blank line
+            const events = buffer.split('\n\n');
+            buffer = events.pop();
+            for (const event of events) {
+                if (!event.startsWith('data: ')) continue;
+                const data = JSON.parse(event.slice('data: '.length));
+                if (data.text) onText(data.text);
+            }
+        }
     },
 
     async getHistory(sessionId) {
@@ -107,8 +124,15 @@ const Chat = () => {
             setInput('');
 
             try {
-                const data = await apiService.sendChatMessage(trimmedInput, sessionId);
-                setMessages((prev) => [...prev, { text: data.response, isUser: false }]);
+                // Show the response as it streams in: the SQL query first, then the results
+                let responseText = '';
+                await apiService.streamChatMessage(trimmedInput, sessionId, (text) => {
+                    const isFirstChunk = responseText === '';
+                    responseText += text;
+                    const message = { text: responseText, isUser: false };
+                    setMessages((prev) => (isFirstChunk ? [...prev, message] : [...prev.slice(0, -1), message]));
+                    scrollToBottom();
+                });
             } catch (error) {
                 setMessages((prev) => [...prev, { text: error.message, isUser: false }]);
             } finally {
@@ -11,22 +11,30 @@ This module helps in debugging and monitoring the system's behavior and performa
 import os
 
 
+def _enabled(name):
+    """
+    Return True if the environment variable is set to a truthy value
+    ("1", "true" or "yes"), so that e.g. TRACE_LOGFIRE=false stays disabled.
+    """
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes")
+
+
 def init_tracing(sql_engine):
     """
     Initialize tracing and observability tools based on environment variables.
 
     Configures integration with the following tools if the corresponding environment
-    variables are set.
+    variables are set. The tracing packages are only imported when enabled.
     """
 
-    if os.getenv("TRACE_LOGFIRE", False):
+    if _enabled("TRACE_LOGFIRE"):
         print("Initializing Logfire tracing")
         import logfire
         logfire.configure()
         logfire.instrument_sqlalchemy(engine=sql_engine.engine)
         logfire.instrument_openai(sql_engine.client)
 
-    if os.getenv("TRACE_PHOENIX", False):
+    if _enabled("TRACE_PHOENIX"):
         print("Initializing Phoenix tracing")
         import phoenix as px
         from phoenix.otel import register
@@ -35,6 +43,6 @@ def init_tracing(sql_engine):
         tracer_provider = register()
         OpenAIInstrumentor().instrument(tracer_provider=tracer_provider)
 
-    # if os.getenv("TRACE_SIMPLE", False):
+    # if _enabled("TRACE_SIMPLE"):
     #     print("Initializing stdout tracing")
     #     set_global_handler("simple")